@@ -7,8 +7,8 @@ import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import func, case
 
 from ..database.models import Product, PriceHistory, PriceAlert
 from ..database.connection import get_db_session
@@ -28,7 +28,11 @@ class PriceTracker:
     
     def __init__(self):
         """Initialize the Price Tracker with all necessary services"""
-        self.serpapi_client = SerpApiClient(settings.serpapi_key)
+        self.serpapi_client = SerpApiClient(
+            settings.serpapi_key,
+            requests_per_minute=settings.requests_per_minute,
+            burst_limit=settings.burst_limit
+        )
         self.price_monitor = PriceMonitor()
         self.prediction_engine = PricePredictionEngine()
         self.notification_manager = NotificationManager()
@@ -118,6 +122,8 @@ class PriceTracker:
                 product.is_active = False
                 session.commit()
                 
+                self.price_monitor.invalidate_product(product_id)
+                
                 logger.info(f"Deactivated product: {product.name} (ID: {product_id})")
                 return True
                 
@@ -198,6 +204,8 @@ class PriceTracker:
                 session.commit()
                 session.refresh(product)
                 
+                self.price_monitor.invalidate_product(product_id)
+                
                 logger.info(f"Updated product {product_id}: {updates}")
                 return product
                 
@@ -237,6 +245,149 @@ class PriceTracker:
             
             return query.all()
     
+    def get_product_counts(self) -> Dict[str, int]:
+        """
+        Get product counts with one aggregate query
+
+        Counting in SQL avoids materializing every Product row just to
+        take lengths of filtered lists.
+
+        Returns:
+            Dict with total, active and inactive counts
+        """
+        with get_db_session() as session:
+            total, active = session.query(
+                func.count(Product.id),
+                func.coalesce(
+                    func.sum(case((Product.is_active == True, 1), else_=0)), 0
+                )
+            ).one()
+
+            return {
+                "total": int(total),
+                "active": int(active),
+                "inactive": int(total) - int(active)
+            }
+
+    def iter_price_history(
+        self,
+        product_id: str,
+        days: Optional[int] = None
+    ):
+        """
+        Stream price history rows for a product
+
+        Uses yield_per so large histories are fetched in chunks instead
+        of materializing every row up front.
+
+        Args:
+            product_id: Product ID
+            days: Number of days back to retrieve
+
+        Yields:
+            PriceHistory instances, newest first
+        """
+        with get_db_session() as session:
+            query = session.query(PriceHistory).filter(
+                PriceHistory.product_id == product_id
+            ).order_by(PriceHistory.checked_at.desc())
+
+            if days:
+                cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+                query = query.filter(PriceHistory.checked_at >= cutoff_date)
+
+            yield from query.yield_per(500)
+
+    async def check_all_prices(self) -> List[Dict[str, Any]]:
+        """
+        Check prices for every active product concurrently
+
+        Checks fan out through the shared SerpApi client, whose pooled
+        keep-alive connections amortize the TLS handshake across the
+        sweep; the semaphore keeps the burst within the configured
+        concurrency.
+
+        Returns:
+            List of per-product result dicts
+        """
+        products = await asyncio.to_thread(self.get_products, active_only=True)
+        semaphore = asyncio.Semaphore(settings.max_concurrent_checks)
+
+        async def check_one(product):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.check_product_price, product.id
+                )
+
+        outcomes = await asyncio.gather(
+            *(check_one(product) for product in products),
+            return_exceptions=True
+        )
+
+        results = []
+        for product, outcome in zip(products, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Price check failed for {product.name}: {outcome}")
+                results.append({
+                    "product_id": product.id,
+                    "success": False,
+                    "alerts": []
+                })
+            else:
+                results.append({
+                    "product_id": product.id,
+                    "success": outcome is not None,
+                    "price": outcome.price if outcome else None,
+                    "alerts": []
+                })
+
+        return results
+
+    def get_price_histories_bulk(
+        self,
+        product_ids: List[str],
+        days: Optional[int] = None,
+        per_product_limit: Optional[int] = None
+    ) -> Dict[str, List[PriceHistory]]:
+        """
+        Get price history for many products with a single query
+
+        One IN query replaces a round-trip per product; rows are
+        grouped in Python afterwards.
+
+        Args:
+            product_ids: Product IDs to fetch history for
+            days: Number of days back to retrieve
+            per_product_limit: Cap on records kept per product
+
+        Returns:
+            Mapping of product ID to its history, newest first
+        """
+        if not product_ids:
+            return {}
+
+        with get_db_session() as session:
+            query = session.query(PriceHistory).filter(
+                PriceHistory.product_id.in_(product_ids)
+            ).order_by(
+                PriceHistory.product_id,
+                PriceHistory.checked_at.desc()
+            )
+
+            if days:
+                cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+                query = query.filter(PriceHistory.checked_at >= cutoff_date)
+
+            histories: Dict[str, List[PriceHistory]] = {
+                product_id: [] for product_id in product_ids
+            }
+            for record in query.all():
+                bucket = histories[record.product_id]
+                if per_product_limit is None or len(bucket) < per_product_limit:
+                    bucket.append(record)
+
+            return histories
+
     def get_current_deals(
         self,
         max_price: Optional[float] = None,
@@ -255,8 +406,12 @@ class PriceTracker:
             List of deal information
         """
         with get_db_session() as session:
-            # Query for recent price history with deals
-            query = session.query(PriceHistory).join(Product).filter(
+            # Query for recent price history with deals; the joined
+            # Product rows are loaded eagerly so the formatting loop
+            # below doesn't lazy-load one Product per deal
+            query = session.query(PriceHistory).join(Product).options(
+                contains_eager(PriceHistory.product)
+            ).filter(
                 Product.is_active == True,
                 PriceHistory.is_deal == True
             )
@@ -322,9 +477,27 @@ class PriceTracker:
                 return None
             
             try:
-                # Use price monitor to check price
-                price_record = self.price_monitor.check_single_product(product)
-                
+                # Use price monitor to check price (async) from a sync context
+                try:
+                    loop = asyncio.get_event_loop()
+                    if loop.is_running():
+                        # If we're in an async context, create a new thread
+                        import concurrent.futures
+                        with concurrent.futures.ThreadPoolExecutor() as executor:
+                            future = executor.submit(
+                                asyncio.run,
+                                self.price_monitor.check_single_product(product)
+                            )
+                            price_record = future.result()
+                    else:
+                        price_record = loop.run_until_complete(
+                            self.price_monitor.check_single_product(product)
+                        )
+                except RuntimeError:
+                    price_record = asyncio.run(
+                        self.price_monitor.check_single_product(product)
+                    )
+
                 if price_record:
                     logger.info(f"Price check completed for {product.name}: ${price_record.price}")
                 
@@ -507,7 +680,7 @@ class PriceTracker:
             await asyncio.sleep(1)
             
             # Perform price check
-            price_record = self.price_monitor.check_single_product(product)
+            price_record = await self.price_monitor.check_single_product(product)
             
             if price_record:
                 logger.info(f"Initial price check completed for {product.name}: ${price_record.price}")
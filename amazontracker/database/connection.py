@@ -4,8 +4,9 @@ Database connection and session management
 
 import logging
 from contextlib import contextmanager
-from typing import Generator
-from sqlalchemy import create_engine, event
+from contextvars import ContextVar
+from typing import Generator, Optional
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
@@ -18,6 +19,13 @@ logger = logging.getLogger(__name__)
 engine = None
 SessionLocal = None
 
+# Session shared by the current task/context (see shared_db_session);
+# when set, nested get_db_session calls reuse it instead of checking
+# out another pool connection
+_shared_session: ContextVar[Optional[Session]] = ContextVar(
+    "shared_db_session", default=None
+)
+
 
 def init_database():
     """Initialize database engine and session factory"""
@@ -35,6 +43,18 @@ def init_database():
                 poolclass=StaticPool,
                 **engine_config
             )
+
+            # Tune each new SQLite connection for write-heavy logging:
+            # WAL avoids writer/reader blocking and synchronous=NORMAL
+            # drops the per-commit fsync while staying crash-safe in WAL
+            @event.listens_for(engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA cache_size=-64000")
+                cursor.close()
         else:
             # PostgreSQL and other databases
             engine = create_engine(
@@ -42,15 +62,22 @@ def init_database():
                 **engine_config
             )
         
-        # Create session factory
+        # Create session factory. expire_on_commit=False keeps
+        # attribute values populated after commit so hot paths can
+        # return records without a refresh round-trip.
         SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
+            expire_on_commit=False,
             bind=engine
         )
         
         # Create tables
         Base.metadata.create_all(bind=engine)
+
+        # create_all never alters existing tables, so add any columns
+        # the models gained since the database was created
+        _apply_schema_upgrades(engine)
         
         logger.info(f"Database initialized: {settings.database_url}")
         
@@ -59,6 +86,35 @@ def init_database():
         raise
 
 
+def _apply_schema_upgrades(db_engine):
+    """
+    Add columns the models define but an existing database lacks
+
+    Deployments created before a column was added (e.g.
+    price_history.raw_data_zst) would otherwise fail every query on
+    that table with "no such column". ALTER TABLE ADD COLUMN covers
+    nullable additions without pulling in a migration framework.
+    """
+    inspector = inspect(db_engine)
+
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+
+            col_type = column.type.compile(db_engine.dialect)
+            with db_engine.begin() as conn:
+                conn.execute(text(
+                    f"ALTER TABLE {table.name} "
+                    f"ADD COLUMN {column.name} {col_type}"
+                ))
+            logger.info(f"Added missing column {table.name}.{column.name}")
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Database session dependency for FastAPI
@@ -81,6 +137,40 @@ def get_db_session() -> Generator[Session, None, None]:
     """
     Context manager for database sessions
     
+    Reuses the context-local session installed by shared_db_session when
+    one is active, so sequential helpers in a batch share a single pool
+    connection.
+    
+    Yields:
+        Database session
+    """
+    shared = _shared_session.get()
+    if shared is not None:
+        yield shared
+        return
+    
+    if SessionLocal is None:
+        init_database()
+    
+    session = SessionLocal()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+@contextmanager
+def shared_db_session() -> Generator[Session, None, None]:
+    """
+    Install one session for all get_db_session calls in this context
+    
+    Intended for sequential work (e.g. a monitoring batch's read and
+    write phases); the shared session is not safe for concurrent use
+    from multiple tasks.
+    
     Yields:
         Database session
     """
@@ -88,12 +178,14 @@ def get_db_session() -> Generator[Session, None, None]:
         init_database()
     
     session = SessionLocal()
+    token = _shared_session.set(session)
     try:
         yield session
     except Exception:
         session.rollback()
         raise
     finally:
+        _shared_session.reset(token)
         session.close()
 
 
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from typing import Optional, List
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, Boolean, Text, 
-    ForeignKey, Index, UniqueConstraint, CheckConstraint
+    ForeignKey, Index, LargeBinary, UniqueConstraint, CheckConstraint
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, Session
@@ -100,7 +100,8 @@ class PriceHistory(Base):
     source = Column(String(50), default="serpapi")
     
     # Raw data
-    raw_data = Column(Text, nullable=True)  # JSON string of raw API response
+    raw_data = Column(Text, nullable=True)  # Legacy plain JSON string (pre-compression rows)
+    raw_data_zst = Column(LargeBinary, nullable=True)  # zstd-compressed JSON of raw API response
     
     # Relationship
     product = relationship("Product", back_populates="price_history")
@@ -110,12 +111,25 @@ class PriceHistory(Base):
         Index('idx_price_history_product_date', 'product_id', 'checked_at'),
         Index('idx_price_history_price', 'price'),
         Index('idx_price_history_deals', 'is_deal', 'checked_at'),
+        Index('idx_price_history_deal_discount', 'is_deal', 'discount_percentage'),  # Deals listing order
+        Index('idx_price_history_checked_at', 'checked_at'),  # Retention cleanup range scans
     )
     
     def __repr__(self):
         return f"<PriceHistory(product_id='{self.product_id}', price={self.price}, checked_at='{self.checked_at}')>"
 
 
+# Composite index matching the previous-price lookup
+# (product_id = ? ORDER BY checked_at DESC LIMIT 1); INCLUDE makes it
+# index-only on PostgreSQL and is ignored elsewhere
+Index(
+    'idx_price_history_product_checked_desc',
+    PriceHistory.product_id,
+    PriceHistory.checked_at.desc(),
+    postgresql_include=['price']
+)
+
+
 class PriceAlert(Base):
     """Price alert model for tracking when alerts are sent"""
     __tablename__ = "price_alerts"
@@ -248,16 +262,44 @@ class NotificationLog(Base):
     sent_at = Column(DateTime(timezone=True), nullable=True)
     
     # Indexes
+    # The log table is append-only: stats are served from
+    # NotificationCounter, so only the audit-query index on created_at
+    # is kept to minimize per-insert index maintenance.
     __table_args__ = (
-        Index('idx_notification_logs_type_status', 'notification_type', 'status'),
         Index('idx_notification_logs_created_at', 'created_at'),
-        Index('idx_notification_logs_product', 'product_id'),
     )
-    
+
     def __repr__(self):
         return f"<NotificationLog(type='{self.notification_type}', recipient='{self.recipient}', status='{self.status}')>"
 
 
+class NotificationCounter(Base):
+    """Aggregated notification counts by type and status
+
+    Maintained incrementally on every log write so that
+    get_notification_stats reads a handful of counter rows instead of
+    scanning the append-only notification log.
+    """
+    __tablename__ = "notification_counters"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+
+    # Counter key
+    notification_type = Column(String(50), nullable=False)  # email, slack, desktop
+    status = Column(String(20), nullable=False)  # sent, failed, pending, bounced
+
+    # Counter value
+    count = Column(Integer, nullable=False, default=0)
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('notification_type', 'status', name='uq_notification_counters_type_status'),
+    )
+
+    def __repr__(self):
+        return f"<NotificationCounter(type='{self.notification_type}', status='{self.status}', count={self.count})>"
+
+
 class APIUsage(Base):
     """API usage tracking model"""
     __tablename__ = "api_usage"
@@ -4,19 +4,44 @@ Notification manager for sending alerts via multiple channels
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
+from sqlalchemy import func
+
 from .email_sender import EmailSender
 from .slack_sender import SlackSender
 from .desktop_notifier import DesktopNotifier
-from ..database.models import NotificationLog
+from ..database.models import NotificationLog, NotificationCounter
 from ..database.connection import get_db_session
 from ..utils.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _TestProduct:
+    """Synthetic product used by send_test_notification"""
+    id: str
+    name: str
+    target_price: float
+    amazon_url: str
+
+
+@dataclass(slots=True)
+class _TestPriceRecord:
+    """Synthetic price record used by send_test_notification"""
+    price: float
+    old_price: float
+    discount_percentage: float
+    savings_amount: float
+    rating: float
+    reviews_count: int
+    prime_eligible: bool
+    checked_at: datetime
+
+
 class NotificationManager:
     """
     Manages all notification channels and delivery
@@ -27,154 +52,160 @@ class NotificationManager:
         self.email_sender = EmailSender() if settings.email_enabled else None
         self.slack_sender = SlackSender() if settings.slack_enabled else None
         self.desktop_notifier = DesktopNotifier() if settings.desktop_notifications_enabled else None
-        
+
+        # Channel dispatch table: channel name -> (sender attribute, send helper)
+        self._channels = {
+            "email": ("email_sender", self._send_via_email),
+            "slack": ("slack_sender", self._send_via_slack),
+            "desktop": ("desktop_notifier", self._send_via_desktop),
+        }
+
+        # Channels are fixed at startup, so compute the available set once
+        self._available_channels = tuple(
+            channel for channel, (sender_attr, _) in self._channels.items()
+            if getattr(self, sender_attr) is not None
+        )
+
         logger.info("Notification manager initialized")
+
+    async def close(self):
+        """Close pooled resources held by notification channels"""
+        if self.slack_sender:
+            await self.slack_sender.close()
     
     async def send_email_alert(self, notification_data: Dict[str, Any]) -> bool:
         """
         Send email alert notification
-        
+
         Args:
             notification_data: Notification data containing product, price, and alert info
-            
+
         Returns:
             True if successful, False otherwise
         """
-        if not self.email_sender:
-            logger.warning("Email notifications not enabled")
-            return False
-        
-        try:
-            product = notification_data['product']
-            price_record = notification_data['price_record']
-            alert_data = notification_data['alert_data']
-            
-            # Prepare email content
-            subject = self._generate_email_subject(product, alert_data)
-            html_content = self._generate_email_html(notification_data)
-            text_content = self._generate_email_text(notification_data)
-            
-            # Send email
-            success = await self.email_sender.send_price_alert(
-                to_email=settings.email_username,  # Send to configured email
-                subject=subject,
-                html_content=html_content,
-                text_content=text_content,
-                product=product,
-                price_record=price_record
-            )
-            
-            # Log notification
-            await self._log_notification(
-                notification_type="email",
-                recipient=settings.email_username,
-                subject=subject,
-                message=text_content,
-                status="sent" if success else "failed",
-                product_id=product.id,
-                alert_id=notification_data.get('alert', {}).get('id')
-            )
-            
-            return success
-            
-        except Exception as e:
-            logger.error(f"Failed to send email alert: {e}")
-            return False
-    
+        return await self._dispatch("email", notification_data)
+
     async def send_slack_alert(self, notification_data: Dict[str, Any]) -> bool:
         """
         Send Slack alert notification
-        
+
         Args:
             notification_data: Notification data
-            
+
         Returns:
             True if successful, False otherwise
         """
-        if not self.slack_sender:
-            logger.warning("Slack notifications not enabled")
-            return False
-        
-        try:
-            product = notification_data['product']
-            price_record = notification_data['price_record']
-            alert_data = notification_data['alert_data']
-            
-            # Generate Slack message
-            message = self._generate_slack_message(notification_data)
-            
-            # Send Slack message
-            success = await self.slack_sender.send_price_alert(
-                message=message,
-                product=product,
-                price_record=price_record,
-                alert_data=alert_data
-            )
-            
-            # Log notification
-            await self._log_notification(
-                notification_type="slack",
-                recipient="slack_channel",
-                subject=f"Price Alert: {product.name}",
-                message=message,
-                status="sent" if success else "failed",
-                product_id=product.id,
-                alert_id=notification_data.get('alert', {}).get('id')
-            )
-            
-            return success
-            
-        except Exception as e:
-            logger.error(f"Failed to send Slack alert: {e}")
-            return False
-    
+        return await self._dispatch("slack", notification_data)
+
     async def send_desktop_alert(self, notification_data: Dict[str, Any]) -> bool:
         """
         Send desktop notification
-        
+
         Args:
             notification_data: Notification data
-            
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._dispatch("desktop", notification_data)
+
+    async def _dispatch(self, channel: str, notification_data: Dict[str, Any]) -> bool:
+        """
+        Send an alert over one channel: generate content, send, and log
+
+        Args:
+            channel: Channel name (email, slack, desktop)
+            notification_data: Notification data
+
         Returns:
             True if successful, False otherwise
         """
-        if not self.desktop_notifier:
-            logger.warning("Desktop notifications not enabled")
+        sender_attr, send_fn = self._channels[channel]
+        sender = getattr(self, sender_attr)
+
+        if not sender:
+            logger.warning(f"{channel.capitalize()} notifications not enabled")
             return False
-        
+
         try:
             product = notification_data['product']
-            price_record = notification_data['price_record']
-            alert_data = notification_data['alert_data']
-            
-            # Generate desktop notification
-            title = f"Price Alert: {product.name}"
-            message = self._generate_desktop_message(notification_data)
-            
-            # Send desktop notification
-            success = await self.desktop_notifier.send_notification(
-                title=title,
-                message=message,
-                product=product,
-                price_record=price_record
+
+            success, recipient, subject, message = await send_fn(
+                sender, notification_data
             )
-            
+
             # Log notification
             await self._log_notification(
-                notification_type="desktop",
-                recipient="local_user",
-                subject=title,
+                notification_type=channel,
+                recipient=recipient,
+                subject=subject,
                 message=message,
                 status="sent" if success else "failed",
                 product_id=product.id,
                 alert_id=notification_data.get('alert', {}).get('id')
             )
-            
+
             return success
-            
+
         except Exception as e:
-            logger.error(f"Failed to send desktop alert: {e}")
+            logger.error(f"Failed to send {channel} alert: {e}")
             return False
+
+    async def _send_via_email(self, sender, notification_data):
+        """Send one email alert, returning (success, recipient, subject, message)"""
+        product = notification_data['product']
+        price_record = notification_data['price_record']
+        alert_data = notification_data['alert_data']
+
+        # Prepare email content
+        subject = self._generate_email_subject(product, alert_data)
+        html_content = self._generate_email_html(notification_data)
+        text_content = self._generate_email_text(notification_data)
+
+        success = await sender.send_price_alert(
+            to_email=settings.email_username,  # Send to configured email
+            subject=subject,
+            html_content=html_content,
+            text_content=text_content,
+            product=product,
+            price_record=price_record
+        )
+
+        return success, settings.email_username, subject, text_content
+
+    async def _send_via_slack(self, sender, notification_data):
+        """Send one Slack alert, returning (success, recipient, subject, message)"""
+        product = notification_data['product']
+        price_record = notification_data['price_record']
+        alert_data = notification_data['alert_data']
+
+        message = self._generate_slack_message(notification_data)
+
+        success = await sender.send_price_alert(
+            message=message,
+            product=product,
+            price_record=price_record,
+            alert_data=alert_data
+        )
+
+        return success, "slack_channel", f"Price Alert: {product.name}", message
+
+    async def _send_via_desktop(self, sender, notification_data):
+        """Send one desktop alert, returning (success, recipient, subject, message)"""
+        product = notification_data['product']
+        price_record = notification_data['price_record']
+
+        title = f"Price Alert: {product.name}"
+        message = self._generate_desktop_message(notification_data)
+
+        success = await sender.send_notification(
+            title=title,
+            message=message,
+            product=product,
+            price_record=price_record
+        )
+
+        return success, "local_user", title, message
     
     async def send_test_notification(
         self,
@@ -194,22 +225,22 @@ class NotificationManager:
         try:
             # Create test notification data
             test_data = {
-                'product': type('TestProduct', (), {
-                    'id': 'test-product-id',
-                    'name': 'Test Product',
-                    'target_price': 99.99,
-                    'amazon_url': 'https://amazon.com/test'
-                })(),
-                'price_record': type('TestPriceRecord', (), {
-                    'price': 89.99,
-                    'old_price': 109.99,
-                    'discount_percentage': 18.18,
-                    'savings_amount': 20.00,
-                    'rating': 4.5,
-                    'reviews_count': 1234,
-                    'prime_eligible': True,
-                    'checked_at': datetime.now(timezone.utc)
-                })(),
+                'product': _TestProduct(
+                    id='test-product-id',
+                    name='Test Product',
+                    target_price=99.99,
+                    amazon_url='https://amazon.com/test'
+                ),
+                'price_record': _TestPriceRecord(
+                    price=89.99,
+                    old_price=109.99,
+                    discount_percentage=18.18,
+                    savings_amount=20.00,
+                    rating=4.5,
+                    reviews_count=1234,
+                    prime_eligible=True,
+                    checked_at=datetime.now(timezone.utc)
+                ),
                 'alert_data': {
                     'type': 'test_alert',
                     'message': 'This is a test notification',
@@ -243,37 +274,42 @@ class NotificationManager:
         message: str
     ) -> Dict[str, bool]:
         """
-        Send notification to multiple recipients
-        
+        Send notification to multiple recipients concurrently
+
+        Sends are parallelized with a semaphore bounded by
+        settings.max_concurrent_checks so a large recipient list does
+        not take recipients x send-latency wall time.
+
         Args:
             notification_type: Type of notification
             recipients: List of recipients
             subject: Notification subject
             message: Notification message
-            
+
         Returns:
             Dictionary mapping recipients to success status
         """
-        results = {}
-        
-        for recipient in recipients:
-            try:
-                if notification_type == "email" and self.email_sender:
+        if notification_type != "email" or not self.email_sender:
+            logger.warning(f"Bulk notification not supported for type: {notification_type}")
+            return {recipient: False for recipient in recipients}
+
+        semaphore = asyncio.Semaphore(settings.max_concurrent_checks)
+
+        async def send_one(recipient: str):
+            async with semaphore:
+                try:
                     success = await self.email_sender.send_simple_email(
                         to_email=recipient,
                         subject=subject,
                         text_content=message
                     )
-                    results[recipient] = success
-                else:
-                    logger.warning(f"Bulk notification not supported for type: {notification_type}")
-                    results[recipient] = False
-                    
-            except Exception as e:
-                logger.error(f"Failed to send notification to {recipient}: {e}")
-                results[recipient] = False
-        
-        return results
+                    return recipient, success
+                except Exception as e:
+                    logger.error(f"Failed to send notification to {recipient}: {e}")
+                    return recipient, False
+
+        results = await asyncio.gather(*(send_one(r) for r in recipients))
+        return dict(results)
     
     def _generate_email_subject(self, product, alert_data) -> str:
         """Generate email subject line"""
@@ -294,8 +330,10 @@ class NotificationManager:
         price_record = notification_data['price_record']
         alert_data = notification_data['alert_data']
         
-        # This would typically use a template engine like Jinja2
-        html = f"""
+        # This would typically use a template engine like Jinja2.
+        # Collect fragments and join once rather than building
+        # intermediate strings with +=.
+        parts = [f"""
         <html>
         <head>
             <style>
@@ -320,31 +358,31 @@ class NotificationManager:
                     <div class="product-title">{product.name}</div>
                     <div class="price-info">
                         <div class="current-price">${price_record.price:.2f}</div>
-        """
-        
+        """]
+
         if price_record.old_price:
-            html += f'<div class="old-price">${price_record.old_price:.2f}</div>'
-        
+            parts.append(f'<div class="old-price">${price_record.old_price:.2f}</div>')
+
         if price_record.savings_amount:
-            html += f'<div class="savings">Save ${price_record.savings_amount:.2f}</div>'
-        
-        html += f"""
+            parts.append(f'<div class="savings">Save ${price_record.savings_amount:.2f}</div>')
+
+        parts.append(f"""
                     </div>
                     <p><strong>Alert Type:</strong> {alert_data['type'].replace('_', ' ').title()}</p>
                     <p><strong>Message:</strong> {alert_data['message']}</p>
-        """
-        
+        """)
+
         if hasattr(product, 'amazon_url') and product.amazon_url:
-            html += f'<p><a href="{product.amazon_url}" class="button">View on Amazon</a></p>'
-        
-        html += """
+            parts.append(f'<p><a href="{product.amazon_url}" class="button">View on Amazon</a></p>')
+
+        parts.append("""
                 </div>
             </div>
         </body>
         </html>
-        """
-        
-        return html
+        """)
+
+        return "".join(parts)
     
     def _generate_email_text(self, notification_data) -> str:
         """Generate plain text email content"""
@@ -428,6 +466,8 @@ class NotificationManager:
             error_message: Error message if failed
         """
         try:
+            now = datetime.now(timezone.utc)
+
             with get_db_session() as session:
                 log_entry = NotificationLog(
                     notification_type=notification_type,
@@ -438,71 +478,109 @@ class NotificationManager:
                     product_id=product_id,
                     alert_id=alert_id,
                     error_message=error_message,
-                    created_at=datetime.now(timezone.utc),
-                    sent_at=datetime.now(timezone.utc) if status == "sent" else None
+                    created_at=now,
+                    sent_at=now if status == "sent" else None
                 )
                 
                 session.add(log_entry)
+
+                # Keep the aggregated counters in sync so stats reads
+                # never have to scan the log table
+                counter = session.query(NotificationCounter).filter(
+                    NotificationCounter.notification_type == notification_type,
+                    NotificationCounter.status == status
+                ).first()
+
+                if counter:
+                    counter.count += 1
+                else:
+                    session.add(NotificationCounter(
+                        notification_type=notification_type,
+                        status=status,
+                        count=1
+                    ))
+
                 session.commit()
-                
+
         except Exception as e:
             logger.error(f"Failed to log notification: {e}")
     
     def get_notification_stats(self) -> Dict[str, Any]:
-        """Get notification statistics"""
+        """Get notification statistics from the aggregated counters"""
         try:
             with get_db_session() as session:
-                # Get counts by type and status
-                total_notifications = session.query(NotificationLog).count()
-                
-                sent_notifications = session.query(NotificationLog).filter(
-                    NotificationLog.status == "sent"
-                ).count()
-                
-                failed_notifications = session.query(NotificationLog).filter(
-                    NotificationLog.status == "failed"
-                ).count()
-                
-                # Get counts by type
-                email_count = session.query(NotificationLog).filter(
-                    NotificationLog.notification_type == "email"
-                ).count()
-                
-                slack_count = session.query(NotificationLog).filter(
-                    NotificationLog.notification_type == "slack"
-                ).count()
-                
-                desktop_count = session.query(NotificationLog).filter(
-                    NotificationLog.notification_type == "desktop"
-                ).count()
-                
+                counters = session.query(NotificationCounter).all()
+
+                if not counters:
+                    counters = self._seed_counters_from_log(session)
+
+                total_notifications = 0
+                sent_notifications = 0
+                failed_notifications = 0
+                by_type = {'email': 0, 'slack': 0, 'desktop': 0}
+
+                for counter in counters:
+                    total_notifications += counter.count
+
+                    if counter.status == "sent":
+                        sent_notifications += counter.count
+                    elif counter.status == "failed":
+                        failed_notifications += counter.count
+
+                    if counter.notification_type in by_type:
+                        by_type[counter.notification_type] += counter.count
+
                 return {
                     'total': total_notifications,
                     'sent': sent_notifications,
                     'failed': failed_notifications,
                     'success_rate': (sent_notifications / total_notifications * 100) if total_notifications > 0 else 0,
-                    'by_type': {
-                        'email': email_count,
-                        'slack': slack_count,
-                        'desktop': desktop_count
-                    }
+                    'by_type': by_type
                 }
-                
+
         except Exception as e:
             logger.error(f"Failed to get notification stats: {e}")
             return {}
+
+    def _seed_counters_from_log(self, session) -> List[NotificationCounter]:
+        """
+        Backfill notification counters from existing log rows
+
+        Uses a single grouped aggregate (one scan) instead of separate
+        COUNT(*) queries per type and status. Only runs when the
+        counters table is empty, e.g. on databases created before the
+        counters were introduced.
+
+        Args:
+            session: Active database session
+
+        Returns:
+            The freshly created counter rows
+        """
+        grouped = session.query(
+            NotificationLog.notification_type,
+            NotificationLog.status,
+            func.count().label('count')
+        ).group_by(
+            NotificationLog.notification_type,
+            NotificationLog.status
+        ).all()
+
+        counters = [
+            NotificationCounter(
+                notification_type=notification_type,
+                status=status,
+                count=count
+            )
+            for notification_type, status, count in grouped
+        ]
+
+        if counters:
+            session.add_all(counters)
+            session.commit()
+
+        return counters
     
     def get_available_channels(self) -> List[str]:
         """Get list of available notification channels"""
-        channels = []
-        
-        if self.email_sender:
-            channels.append('email')
-        
-        if self.slack_sender:
-            channels.append('slack')
-        
-        if self.desktop_notifier:
-            channels.append('desktop')
-        
-        return channels
+        return list(self._available_channels)
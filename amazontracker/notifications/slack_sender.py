@@ -3,29 +3,239 @@ Slack notification sender for price alerts
 """
 
 import asyncio
-import aiohttp
+import httpx
 import logging
+import random
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+try:
+    import fastjsonschema
+
+    # Compiled once at import into a straight-line Python function, so
+    # malformed alert_data is rejected locally instead of after a wasted
+    # round-trip to Slack's API
+    _validate_alert = fastjsonschema.compile({
+        "type": "object",
+        "properties": {
+            "type": {"type": "string"},
+            "message": {"type": "string"}
+        },
+        "required": ["type"]
+    })
+    _ValidationError = fastjsonschema.JsonSchemaException
+except ImportError:
+    _validate_alert = None
+    _ValidationError = ValueError
+
 from ..utils.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Alert-type presentation styles: alert_type -> emoji
+_ALERT_STYLES = {
+    "target_reached": "🎯",
+    "deal_found": "🔥",
+    "price_drop": "📉",
+}
+_DEFAULT_STYLE = "💰"
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Truncate text to limit characters, appending an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _mrkdwn(text: str) -> Dict[str, Any]:
+    """Build a mrkdwn text element"""
+    return {"type": "mrkdwn", "text": text}
+
+
+def _section(text: str) -> Dict[str, Any]:
+    """Build a section block with mrkdwn text"""
+    return {"type": "section", "text": _mrkdwn(text)}
+
+
+def _fields_section(*fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a section block with a list of fields"""
+    return {"type": "section", "fields": list(fields)}
+
+
+@lru_cache(maxsize=64)
+def _error_alert_header(error_type: str):
+    """
+    Build the static blocks of an error alert for a given error type
+
+    A failing scraper tends to report the same error_type repeatedly,
+    so the header and type field are cached. The returned dicts are
+    shared templates and must not be mutated by callers.
+    """
+    header = {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": f"🚨 Error Alert: {error_type}"
+        }
+    }
+    type_field = _mrkdwn(f"*Error Type:*\n{error_type}")
+    return header, type_field
+
+
+@lru_cache(maxsize=8)
+def _summary_header(today: str) -> Dict[str, Any]:
+    """
+    Build the daily-summary header block for a given date
+
+    The header only changes once a day, so repeated summary sends reuse
+    the cached block. Treated as an immutable template like the error
+    header above.
+    """
+    return {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": f"📊 Daily Summary - {today}"
+        }
+    }
+
 
 class SlackSender:
     """
     Slack sender for price alerts and notifications
     """
     
-    def __init__(self):
-        """Initialize Slack sender with webhook configuration"""
+    def __init__(self, session: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize Slack sender with webhook configuration
+
+        Args:
+            session: Optional shared httpx client (e.g. owned by
+                NotificationManager). If not provided, a pooled client
+                is created lazily on first send and reused afterwards.
+        """
         self.webhook_url = settings.slack_webhook_url
         self.channel = settings.slack_channel
         self.username = settings.slack_username or "Amazon Price Tracker"
         self.icon_emoji = settings.slack_icon_emoji or ":shopping_bags:"
-        
+
+        self._session = session
+        self._owns_session = session is None
+
+        # Bound simultaneous webhook posts so alert bursts don't trip
+        # Slack's per-webhook rate limit
+        self._send_semaphore = asyncio.Semaphore(
+            getattr(settings, 'slack_max_concurrency', 4)
+        )
+
+        # Alert batching: when slack_batch_interval > 0, price alerts
+        # are queued and a background task flushes them as one message
+        self._batch_interval = getattr(settings, 'slack_batch_interval', 0.0)
+        self._batch_size = 10
+        # Slack rejects messages with more than 50 blocks outright, so
+        # a flush splits into as many messages as the cap requires
+        self._max_blocks_per_message = 50
+        self._alert_queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+
+        # Fire-and-forget sends scheduled via schedule_price_alert;
+        # tracked so drain()/close() can wait for them at shutdown
+        self._pending: set = set()
+
+        # Static payload skeletons, built once; per-send payloads are
+        # created via {**skeleton, ...} so these are never mutated
+        self._base_payload = {
+            "channel": self.channel,
+            "username": self.username,
+            "icon_emoji": self.icon_emoji
+        }
+        self._summary_payload_base = {
+            "channel": self.channel,
+            "username": self.username,
+            "icon_emoji": ":bar_chart:"
+        }
+        self._error_payload_base = {
+            "channel": self.channel,
+            "username": self.username,
+            "icon_emoji": ":rotating_light:"
+        }
+
         logger.info("Slack sender initialized")
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating a pooled one if needed
+
+        HTTP/2 multiplexes concurrent alert posts over a single TLS
+        connection to hooks.slack.com; it degrades to HTTP/1.1 when the
+        h2 package is not installed.
+        """
+        if self._session is None or self._session.is_closed:
+            limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            try:
+                self._session = httpx.AsyncClient(
+                    http2=True, timeout=30.0, limits=limits
+                )
+            except ImportError:
+                self._session = httpx.AsyncClient(timeout=30.0, limits=limits)
+            self._owns_session = True
+        return self._session
+
+    def schedule_price_alert(
+        self,
+        message: str,
+        product: Any,
+        price_record: Any,
+        alert_data: Dict[str, Any]
+    ) -> asyncio.Task:
+        """
+        Send a price alert in the background without blocking the caller
+
+        The caller does not wait for the Slack round trip; the webhook
+        semaphore still bounds how many posts run concurrently. Use
+        drain() to wait for outstanding sends at shutdown.
+
+        Args:
+            message: Formatted message text
+            product: Product object
+            price_record: Price record object
+            alert_data: Alert metadata
+
+        Returns:
+            The scheduled task
+        """
+        task = asyncio.get_running_loop().create_task(
+            self.send_price_alert(message, product, price_record, alert_data)
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    async def drain(self, timeout: float = 30.0):
+        """Wait for outstanding background sends to finish"""
+        if self._pending:
+            await asyncio.wait(self._pending, timeout=timeout)
+
+    async def close(self):
+        """Flush pending alerts and close the HTTP session if owned"""
+        await self.drain()
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+        await self.flush()
+
+        if self._owns_session and self._session and not self._session.is_closed:
+            await self._session.aclose()
     
     async def send_price_alert(
         self,
@@ -36,45 +246,189 @@ class SlackSender:
     ) -> bool:
         """
         Send price alert to Slack channel
-        
+
+        When batching is enabled (slack_batch_interval > 0), the alert
+        is queued and coalesced with other alerts arriving within the
+        flush window; the call then waits for its batch to be posted
+        and returns the actual delivery outcome, so callers' success
+        counters stay honest. Otherwise the alert is posted
+        immediately. Use schedule_price_alert for fire-and-forget.
+
         Args:
             message: Formatted message text
             product: Product object
             price_record: Price record object
             alert_data: Alert metadata
-            
+
         Returns:
             True if successful, False otherwise
         """
-        try:
-            # Create rich Slack message with blocks
-            blocks = self._create_price_alert_blocks(
+        if not self.webhook_url:
+            logger.debug("Slack webhook not configured; skipping send")
+            return False
+
+        if _validate_alert is not None:
+            try:
+                _validate_alert(alert_data)
+            except _ValidationError as e:
+                logger.warning(f"Rejecting malformed alert_data: {e}")
+                return False
+
+        if self._batch_interval <= 0:
+            return await self.send_price_alert_immediate(
                 message, product, price_record, alert_data
             )
-            
-            payload = {
-                "channel": self.channel,
-                "username": self.username,
-                "icon_emoji": self.icon_emoji,
-                "blocks": blocks
-            }
-            
-            # Add fallback text for notifications
-            payload["text"] = f"Price Alert: {product.name} - ${price_record.price:.2f}"
-            
-            success = await self._send_slack_message(payload)
-            
-            if success:
-                logger.info(f"Slack alert sent for product: {product.name}")
-            else:
-                logger.error(f"Failed to send Slack alert for product: {product.name}")
-            
-            return success
-            
+
+        if self._alert_queue is None:
+            self._alert_queue = asyncio.Queue()
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.get_running_loop().create_task(
+                self._flush_loop()
+            )
+
+        # Each queued alert carries a future resolved by the flush with
+        # the delivery result of the message it ended up in
+        outcome = asyncio.get_running_loop().create_future()
+        await self._alert_queue.put(
+            (message, product, price_record, alert_data, outcome)
+        )
+        return await outcome
+
+    async def send_price_alert_immediate(
+        self,
+        message: str,
+        product: Any,
+        price_record: Any,
+        alert_data: Dict[str, Any]
+    ) -> bool:
+        """
+        Send a single price alert to Slack without batching
+
+        Args:
+            message: Formatted message text
+            product: Product object
+            price_record: Price record object
+            alert_data: Alert metadata
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Create rich Slack message with blocks
+        blocks = self._create_price_alert_blocks(
+            message, product, price_record, alert_data
+        )
+
+        payload = {
+            **self._base_payload,
+            "blocks": blocks,
+            # Fallback text for notifications
+            "text": f"Price Alert: {product.name} - ${price_record.price:.2f}"
+        }
+
+        success = await self._send_slack_message(payload)
+
+        if success:
+            logger.info("Slack alert sent for product: %s", product.name)
+        else:
+            logger.error("Failed to send Slack alert for product: %s", product.name)
+
+        return success
+
+    async def flush(self) -> bool:
+        """
+        Drain any queued price alerts immediately
+
+        Returns:
+            True if all pending batches were sent, False otherwise
+        """
+        success = True
+        while self._alert_queue is not None and not self._alert_queue.empty():
+            success = await self._flush_batch() and success
+        return success
+
+    async def _flush_loop(self):
+        """Background task that periodically flushes queued alerts"""
+        try:
+            while True:
+                await asyncio.sleep(self._batch_interval)
+                await self._flush_batch()
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush_batch(self) -> bool:
+        """Send up to one batch of queued alerts, splitting on the block cap"""
+        batch = []
+        while self._alert_queue is not None and not self._alert_queue.empty():
+            batch.append(self._alert_queue.get_nowait())
+            if len(batch) >= self._batch_size:
+                break
+
+        if not batch:
+            return True
+
+        all_sent = True
+        try:
+            # Group alerts into messages that stay under Slack's
+            # 50-block limit (each alert contributes its blocks plus a
+            # divider between alerts)
+            groups: List[List[tuple]] = []
+            group_blocks = 0
+            for item in batch:
+                message, product, price_record, alert_data, _ = item
+                alert_blocks = self._create_price_alert_blocks(
+                    message, product, price_record, alert_data
+                )
+                needed = len(alert_blocks) + (1 if group_blocks else 0)
+                if not groups or group_blocks + needed > self._max_blocks_per_message:
+                    groups.append([])
+                    group_blocks = 0
+                    needed = len(alert_blocks)
+                groups[-1].append((item, alert_blocks))
+                group_blocks += needed
+
+            for group in groups:
+                blocks: List[Dict[str, Any]] = []
+                for (_, alert_blocks) in group:
+                    if blocks:
+                        blocks.append({"type": "divider"})
+                    blocks.extend(alert_blocks)
+
+                first_product = group[0][0][1]
+                payload = {
+                    **self._base_payload,
+                    "blocks": blocks,
+                    "text": (
+                        f"{len(group)} price alerts" if len(group) > 1
+                        else f"Price Alert: {first_product.name}"
+                    )
+                }
+
+                success = await self._send_slack_message(payload)
+                all_sent = all_sent and success
+
+                if success:
+                    logger.info("Slack batch of %d alerts sent", len(group))
+                else:
+                    logger.error("Failed to send Slack batch of %d alerts", len(group))
+
+                # Resolve each queued alert with its message's outcome
+                for ((_, _, _, _, outcome), _) in group:
+                    if not outcome.done():
+                        outcome.set_result(success)
+
+            return all_sent
+
         except Exception as e:
-            logger.error(f"Error sending Slack price alert: {e}")
+            logger.error(f"Error sending batched Slack alerts: {e}")
             return False
-    
+
+        finally:
+            # Never leave a waiter hanging if something above raised
+            for item in batch:
+                outcome = item[4]
+                if not outcome.done():
+                    outcome.set_result(False)
+
     async def send_simple_message(
         self,
         message: str,
@@ -90,26 +444,25 @@ class SlackSender:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            payload = {
-                "channel": channel or self.channel,
-                "username": self.username,
-                "icon_emoji": self.icon_emoji,
-                "text": message
-            }
-            
-            success = await self._send_slack_message(payload)
-            
-            if success:
-                logger.info(f"Slack message sent: {message[:50]}...")
-            else:
-                logger.error("Failed to send Slack message")
-            
-            return success
-            
-        except Exception as e:
-            logger.error(f"Error sending Slack message: {e}")
+        if not self.webhook_url:
+            logger.debug("Slack webhook not configured; skipping send")
             return False
+
+        payload = {
+            **self._base_payload,
+            "text": message
+        }
+        if channel:
+            payload["channel"] = channel
+
+        success = await self._send_slack_message(payload)
+
+        if success:
+            logger.info("Slack message sent: %.50s...", message)
+        else:
+            logger.error("Failed to send Slack message")
+
+        return success
     
     async def send_daily_summary(
         self,
@@ -132,31 +485,32 @@ class SlackSender:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            blocks = self._create_summary_blocks(
-                products_checked, deals_found, alerts_sent, top_deals, errors
-            )
-            
-            payload = {
-                "channel": self.channel,
-                "username": self.username,
-                "icon_emoji": ":bar_chart:",
-                "blocks": blocks,
-                "text": f"Daily Summary - {datetime.now().strftime('%Y-%m-%d')}"
-            }
-            
-            success = await self._send_slack_message(payload)
-            
-            if success:
-                logger.info("Daily summary sent to Slack")
-            else:
-                logger.error("Failed to send daily summary to Slack")
-            
-            return success
-            
-        except Exception as e:
-            logger.error(f"Error sending daily summary to Slack: {e}")
+        if not self.webhook_url:
+            logger.debug("Slack webhook not configured; skipping send")
             return False
+
+        # Format the date once; it appears in both the header block
+        # and the fallback text
+        today = datetime.now().strftime('%Y-%m-%d')
+
+        blocks = self._create_summary_blocks(
+            products_checked, deals_found, alerts_sent, top_deals, errors, today
+        )
+
+        payload = {
+            **self._summary_payload_base,
+            "blocks": blocks,
+            "text": f"Daily Summary - {today}"
+        }
+
+        success = await self._send_slack_message(payload)
+
+        if success:
+            logger.info("Daily summary sent to Slack")
+        else:
+            logger.error("Failed to send daily summary to Slack")
+
+        return success
     
     async def send_error_alert(
         self,
@@ -175,119 +529,166 @@ class SlackSender:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            blocks = [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": f"🚨 Error Alert: {error_type}"
-                    }
-                },
-                {
-                    "type": "section",
-                    "fields": [
-                        {
-                            "type": "mrkdwn",
-                            "text": f"*Time:*\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                        },
-                        {
-                            "type": "mrkdwn",
-                            "text": f"*Error Type:*\n{error_type}"
-                        }
-                    ]
-                },
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*Error Message:*\n```{error_message}```"
-                    }
-                }
-            ]
-            
-            if error_details:
-                details_text = "\n".join([f"• *{k}:* {v}" for k, v in error_details.items()])
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"*Error Details:*\n{details_text}"
-                    }
-                })
-            
-            payload = {
-                "channel": self.channel,
-                "username": self.username,
-                "icon_emoji": ":rotating_light:",
-                "blocks": blocks,
-                "text": f"Error Alert: {error_type}"
-            }
-            
-            success = await self._send_slack_message(payload)
-            
-            if success:
-                logger.info(f"Error alert sent to Slack: {error_type}")
-            else:
-                logger.error("Failed to send error alert to Slack")
-            
-            return success
-            
-        except Exception as e:
-            logger.error(f"Error sending error alert to Slack: {e}")
+        if not self.webhook_url:
+            logger.debug("Slack webhook not configured; skipping send")
             return False
+
+        header, type_field = _error_alert_header(error_type)
+
+        blocks = [
+            header,
+            _fields_section(
+                _mrkdwn(f"*Time:*\n{datetime.now().isoformat(sep=' ', timespec='seconds')}"),
+                type_field
+            ),
+            _section(f"*Error Message:*\n```{error_message}```")
+        ]
+
+        if error_details:
+            details_text = "\n".join(f"• *{k}:* {v}" for k, v in error_details.items())
+            blocks.append(_section(f"*Error Details:*\n{details_text}"))
+
+        payload = {
+            **self._error_payload_base,
+            "blocks": blocks,
+            "text": f"Error Alert: {error_type}"
+        }
+
+        success = await self._send_slack_message(payload)
+
+        if success:
+            logger.info("Error alert sent to Slack: %s", error_type)
+        else:
+            logger.error("Failed to send error alert to Slack")
+
+        return success
     
+    # Error bodies Slack returns for an empty-but-valid webhook POST;
+    # any of them proves the webhook URL resolves and accepts requests
+    _PROBE_RESPONSES = (
+        "invalid_payload",
+        "missing_text_or_fallback_or_attachments",
+        "no_text",
+    )
+
     async def test_connection(self) -> bool:
         """
         Test Slack webhook connection
-        
+
+        By default this probes the webhook with an empty JSON payload
+        and treats Slack's well-known 400 error bodies as proof the
+        webhook is valid — no visible message is posted and no rate
+        limit token is spent on a real send. Set slack_test_visible to
+        post an actual test message to the channel instead.
+
         Returns:
             True if connection successful, False otherwise
         """
-        try:
-            test_message = f"🧪 Test message from Amazon Price Tracker - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            
+        if not self.webhook_url:
+            logger.debug("Slack webhook not configured; skipping send")
+            return False
+
+        if getattr(settings, 'slack_test_visible', False):
+            test_message = f"🧪 Test message from Amazon Price Tracker - {datetime.now().isoformat(sep=' ', timespec='seconds')}"
             success = await self.send_simple_message(test_message)
-            
-            if success:
-                logger.info("Slack connection test successful")
-            else:
-                logger.error("Slack connection test failed")
-            
-            return success
-            
+        else:
+            success = await self._probe_webhook()
+
+        if success:
+            logger.info("Slack connection test successful")
+        else:
+            logger.error("Slack connection test failed")
+
+        return success
+
+    async def _probe_webhook(self) -> bool:
+        """Cheaply verify the webhook without posting a visible message"""
+        try:
+            session = self._get_session()
+            response = await session.post(
+                self.webhook_url,
+                content=b'{}',
+                headers={"Content-Type": "application/json"}
+            )
+            if response.status_code == 200:
+                return True
+
+            return (
+                response.status_code == 400
+                and response.text.strip() in self._PROBE_RESPONSES
+            )
+
         except Exception as e:
             logger.error(f"Slack connection test error: {e}")
             return False
     
+    # HTTP statuses worth retrying: rate limiting and server-side errors
+    _RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
     async def _send_slack_message(self, payload: Dict[str, Any]) -> bool:
         """
         Send message to Slack webhook
-        
+
+        Transient failures (connection errors, timeouts, 429 and 5xx
+        responses) are retried with full-jitter exponential backoff,
+        honoring Slack's Retry-After header when present. Other 4xx
+        responses fail immediately.
+
         Args:
             payload: Slack message payload
-            
+
         Returns:
             True if successful, False otherwise
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    
-                    if response.status == 200:
-                        return True
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Slack API error {response.status}: {error_text}")
-                        return False
-                        
-        except Exception as e:
-            logger.error(f"Error sending Slack message: {e}")
-            return False
+        max_retries = getattr(settings, 'slack_max_retries', 4)
+        base_delay = getattr(settings, 'slack_base_delay', 0.5)
+        max_delay = getattr(settings, 'slack_max_delay', 30.0)
+
+        # Serialize once up front (orjson when available) instead of
+        # letting aiohttp run json.dumps inside every post/retry
+        body = _dumps(payload)
+
+        for attempt in range(max_retries + 1):
+            retry_after = 0.0
+
+            try:
+                session = self._get_session()
+                async with self._send_semaphore:
+                    response = await session.post(
+                        self.webhook_url,
+                        content=body,
+                        headers={"Content-Type": "application/json"}
+                    )
+
+                if response.status_code == 200:
+                    return True
+
+                logger.error(f"Slack API error {response.status_code}: {response.text}")
+
+                if response.status_code not in self._RETRYABLE_STATUSES:
+                    return False
+
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 0))
+                except (TypeError, ValueError):
+                    retry_after = 0.0
+
+            except (httpx.HTTPError, asyncio.TimeoutError) as e:
+                # Transient network failure: fall through to the retry
+                # backoff. CancelledError deliberately propagates so
+                # shutdown isn't swallowed.
+                logger.error(f"Error sending Slack message: {e}")
+
+            if attempt >= max_retries:
+                break
+
+            delay = retry_after or random.uniform(
+                0, min(max_delay, base_delay * (2 ** attempt))
+            )
+            await asyncio.sleep(delay)
+
+        logger.error(f"Slack message failed after {max_retries + 1} attempts")
+        return False
     
     def _create_price_alert_blocks(
         self,
@@ -297,92 +698,62 @@ class SlackSender:
         alert_data: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """Create rich blocks for price alert"""
-        # Determine alert emoji and color
+        # Determine alert emoji
         alert_type = alert_data.get('type', '')
-        if alert_type == 'target_reached':
-            emoji = "🎯"
-            color = "#28a745"  # Green
-        elif alert_type == 'deal_found':
-            emoji = "🔥"
-            color = "#fd7e14"  # Orange
-        elif alert_type == 'price_drop':
-            emoji = "📉"
-            color = "#17a2b8"  # Blue
-        else:
-            emoji = "💰"
-            color = "#6c757d"  # Gray
-        
+        emoji = _ALERT_STYLES.get(alert_type, _DEFAULT_STYLE)
+
+        fields_section = _fields_section(
+            _mrkdwn(f"*Current Price:*\n${price_record.price:.2f}"),
+            _mrkdwn(f"*Alert Type:*\n{(alert_type or 'Unknown').replace('_', ' ').title()}")
+        )
+
         blocks = [
             {
                 "type": "header",
                 "text": {
                     "type": "plain_text",
-                    "text": f"{emoji} Price Alert: {product.name[:50]}{'...' if len(product.name) > 50 else ''}"
+                    "text": f"{emoji} Price Alert: {_trunc(product.name, 50)}"
                 }
             },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Current Price:*\n${price_record.price:.2f}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Alert Type:*\n{alert_data.get('type', 'Unknown').replace('_', ' ').title()}"
-                    }
-                ]
-            }
+            fields_section
         ]
         
         # Add additional price info if available
         additional_fields = []
+
+        old_price = getattr(price_record, 'old_price', None)
+        if old_price:
+            additional_fields.append(_mrkdwn(f"*Previous Price:*\n~${old_price:.2f}~"))
+
+        savings_amount = getattr(price_record, 'savings_amount', None)
+        if savings_amount:
+            additional_fields.append(_mrkdwn(f"*Savings:*\n${savings_amount:.2f}"))
+
+        target_price = getattr(product, 'target_price', None)
+        if target_price:
+            additional_fields.append(_mrkdwn(f"*Target Price:*\n${target_price:.2f}"))
+
+        rating = getattr(price_record, 'rating', None)
+        if rating:
+            additional_fields.append(_mrkdwn(f"*Rating:*\n{rating}⭐"))
         
-        if hasattr(price_record, 'old_price') and price_record.old_price:
-            additional_fields.append({
-                "type": "mrkdwn",
-                "text": f"*Previous Price:*\n~${price_record.old_price:.2f}~"
-            })
-        
-        if hasattr(price_record, 'savings_amount') and price_record.savings_amount:
-            additional_fields.append({
-                "type": "mrkdwn",
-                "text": f"*Savings:*\n${price_record.savings_amount:.2f}"
-            })
-        
-        if hasattr(product, 'target_price') and product.target_price:
-            additional_fields.append({
-                "type": "mrkdwn",
-                "text": f"*Target Price:*\n${product.target_price:.2f}"
-            })
-        
-        if hasattr(price_record, 'rating') and price_record.rating:
-            additional_fields.append({
-                "type": "mrkdwn",
-                "text": f"*Rating:*\n{price_record.rating}⭐"
-            })
-        
-        # Add additional fields in pairs
-        if additional_fields:
-            for i in range(0, len(additional_fields), 2):
-                fields_pair = additional_fields[i:i+2]
-                blocks.append({
-                    "type": "section",
-                    "fields": fields_pair
-                })
-        
-        # Add message text
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Alert:* {alert_data.get('message', message)}"
-            }
-        })
-        
-        # Add action button if Amazon URL available
-        if hasattr(product, 'amazon_url') and product.amazon_url:
-            blocks.append({
+        # A lone extra field rides along in the main fields section
+        # (well under Slack's 10-fields-per-section limit) instead of
+        # costing its own section block
+        if len(additional_fields) % 2 == 1:
+            fields_section["fields"].append(additional_fields.pop(0))
+
+        # Add remaining additional fields in pairs
+        blocks.extend(
+            _fields_section(*additional_fields[i:i+2])
+            for i in range(0, len(additional_fields), 2)
+        )
+
+        # Add message text, plus an action button if Amazon URL available
+        amazon_url = getattr(product, 'amazon_url', None)
+        blocks.extend([
+            _section(f"*Alert:* {alert_data.get('message', message)}"),
+            *([{
                 "type": "actions",
                 "elements": [
                     {
@@ -391,12 +762,13 @@ class SlackSender:
                             "type": "plain_text",
                             "text": "View on Amazon"
                         },
-                        "url": product.amazon_url,
+                        "url": amazon_url,
                         "style": "primary"
                     }
                 ]
-            })
-        
+            }] if amazon_url else [])
+        ])
+
         return blocks
     
     def _create_summary_blocks(
@@ -405,82 +777,44 @@ class SlackSender:
         deals_found: int,
         alerts_sent: int,
         top_deals: List[Dict[str, Any]],
-        errors: List[str]
+        errors: List[str],
+        today: str
     ) -> List[Dict[str, Any]]:
         """Create blocks for daily summary"""
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"📊 Daily Summary - {datetime.now().strftime('%Y-%m-%d')}"
-                }
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Products Checked:*\n{products_checked}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Deals Found:*\n{deals_found}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Alerts Sent:*\n{alerts_sent}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Success Rate:*\n{(deals_found/products_checked*100):.1f}%" if products_checked > 0 else "*Success Rate:*\n0%"
-                    }
-                ]
-            }
+            _summary_header(today),
+            _fields_section(
+                _mrkdwn(f"*Products Checked:*\n{products_checked}"),
+                _mrkdwn(f"*Deals Found:*\n{deals_found}"),
+                _mrkdwn(f"*Alerts Sent:*\n{alerts_sent}"),
+                _mrkdwn(
+                    f"*Success Rate:*\n{(deals_found/products_checked*100):.1f}%"
+                    if products_checked > 0 else "*Success Rate:*\n0%"
+                )
+            )
         ]
         
         # Add top deals section
         if top_deals:
-            blocks.append({
-                "type": "divider"
-            })
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*🔥 Top Deals Found:*"
-                }
-            })
-            
+            blocks.extend([
+                {"type": "divider"},
+                _section("*🔥 Top Deals Found:*")
+            ])
             for i, deal in enumerate(top_deals[:3], 1):
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"{i}. *{deal.get('name', 'Unknown Product')[:40]}{'...' if len(deal.get('name', '')) > 40 else ''}*\n💰 ${deal.get('price', 0):.2f} (Save ${deal.get('savings', 0):.2f})"
-                    }
-                })
-        
+                name = deal.get('name') or 'Unknown Product'
+                price = deal.get('price', 0)
+                savings = deal.get('savings', 0)
+                blocks.append(_section(
+                    f"{i}. *{_trunc(name, 40)}*\n💰 ${price:.2f} (Save ${savings:.2f})"
+                ))
+
         # Add errors section
         if errors:
-            blocks.append({
-                "type": "divider"
-            })
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*⚠️ Errors Encountered ({len(errors)}):*"
-                }
-            })
-            
-            error_text = "\n".join([f"• {error[:100]}{'...' if len(error) > 100 else ''}" for error in errors[:5]])
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"```{error_text}```"
-                }
-            })
-        
+            error_text = "\n".join(f"• {_trunc(error, 100)}" for error in errors[:5])
+            blocks.extend([
+                {"type": "divider"},
+                _section(f"*⚠️ Errors Encountered ({len(errors)}):*"),
+                _section(f"```{error_text}```")
+            ])
+
         return blocks
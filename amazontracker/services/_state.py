@@ -0,0 +1,23 @@
+"""
+Shared monitor state for lock-free status reads
+
+The web status endpoints used to call into the monitor (and through it
+the scheduler) on every request. Instead, the monitor publishes its
+state here whenever it changes, and readers take plain attribute reads
+— atomic under the GIL, no locks, no scheduler introspection.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class MonitorState:
+    """Last published monitoring-service state"""
+    running: bool = False
+    next_check: Optional[datetime] = None
+
+
+# Process-wide singleton updated by PriceMonitor, read by the web layer
+monitor_state = MonitorState()
@@ -4,29 +4,113 @@ Handles scheduled price checks and monitoring logic
 """
 
 import asyncio
+import heapq
 import logging
 import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Union
+
+from cachetools import TTLCache
+
+try:
+    import zstandard
+
+    _raw_data_compressor = zstandard.ZstdCompressor(level=3)
+
+    def _compress_raw_data(raw: str) -> bytes:
+        return _raw_data_compressor.compress(raw.encode("utf-8"))
+except ImportError:
+    _compress_raw_data = None
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 
+from sqlalchemy import func, insert
+from sqlalchemy.orm import load_only
+
 from ..database.models import Product, PriceHistory, PriceAlert
-from ..database.connection import get_db_session
-from ..services.serpapi_client import SerpApiClient, SerpApiError
+from ..database.connection import get_db_session, shared_db_session
+from ..services.serpapi_client import SerpApiClient, SerpApiError, ProductResult
 from ..notifications.manager import NotificationManager
+from ._state import monitor_state
 from ..utils.config import settings, get_interval_seconds
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class ProductSnapshot:
+    """Immutable view of the product fields the monitor reads per check"""
+    id: str
+    name: str
+    asin: Optional[str]
+    search_query: Optional[str]
+    max_price: Optional[float]
+    target_price: Optional[float]
+    check_interval: Optional[str]
+    email_notifications: bool
+    slack_notifications: bool
+    desktop_notifications: bool
+
+
+@dataclass(slots=True)
+class PriceCheckResult:
+    """Lightweight price-check record handed to alert evaluation"""
+    product_id: str
+    price: float
+    old_price: Optional[float]
+    title: Optional[str]
+    rating: Optional[float]
+    reviews_count: Optional[int]
+    is_deal: bool
+    discount_percentage: Optional[float]
+    savings_amount: Optional[float]
+    prime_eligible: bool
+    checked_at: datetime
+
+
+# Columns a ProductSnapshot needs; load_only() keeps snapshot SELECTs
+# from dragging in the wide description/metadata columns
+_SNAPSHOT_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.asin,
+    Product.search_query,
+    Product.max_price,
+    Product.target_price,
+    Product.check_interval,
+    Product.email_notifications,
+    Product.slack_notifications,
+    Product.desktop_notifications,
+)
+
+
+def _snapshot_product(product: Product) -> ProductSnapshot:
+    """Build a ProductSnapshot from an ORM Product row"""
+    return ProductSnapshot(
+        id=product.id,
+        name=product.name,
+        asin=product.asin,
+        search_query=product.search_query,
+        max_price=product.max_price,
+        target_price=product.target_price,
+        check_interval=product.check_interval,
+        email_notifications=bool(product.email_notifications),
+        slack_notifications=bool(product.slack_notifications),
+        desktop_notifications=bool(product.desktop_notifications)
+    )
+
+
 class PriceMonitor:
     """
     Service for monitoring product prices and triggering alerts
     """
+
+    # Rows deleted per transaction by the retention cleanup
+    CLEANUP_CHUNK_SIZE = 10000
     
     def __init__(self):
         """Initialize the price monitor"""
@@ -35,16 +119,41 @@ class PriceMonitor:
             api_key=settings.serpapi_key,
             timeout=settings.serpapi_timeout,
             retries=settings.serpapi_retries,
-            retry_delay=settings.serpapi_retry_delay
+            retry_delay=settings.serpapi_retry_delay,
+            requests_per_minute=settings.requests_per_minute,
+            burst_limit=settings.burst_limit
         )
         self.notification_manager = NotificationManager()
         self.is_running = False
         self.max_concurrent_checks = settings.max_concurrent_checks
-        self.executor = ThreadPoolExecutor(
-            max_workers=self.max_concurrent_checks
+
+        # Short-TTL search result cache so products sharing an ASIN or
+        # query dedupe their SerpAPI calls within a batch
+        self._search_cache = TTLCache(
+            maxsize=10000,
+            ttl=getattr(settings, 'serpapi_cache_ttl', 60.0)
         )
-        
-        # Performance metrics
+        self._search_cache_lock = asyncio.Lock()
+
+        # Process-local snapshots of active products so each interval's
+        # batch does not re-SELECT unchanged product rows; refreshed by
+        # the maintenance job and invalidated on mutations
+        self._product_cache: Dict[str, ProductSnapshot] = {}
+
+        # Last persisted price per product; lets alert evaluation skip
+        # the previous-price query for products checked before
+        self._last_prices: Dict[str, float] = {}
+
+        # Min-heap of (next_due_ts, product_id) driving a single check
+        # loop; products due within the same window share one batch
+        self._check_heap: List[tuple] = []
+        self._heap_window = 1.0
+        self._last_cache_sync = datetime.now(timezone.utc)
+        self._scheduler_task: Optional[asyncio.Task] = None
+
+        # Performance metrics; average_check_time is a windowed mean
+        # over recent batches rather than a decaying EMA
+        self._recent_durations = deque(maxlen=256)
         self.metrics = {
             'checks_completed': 0,
             'checks_failed': 0,
@@ -65,9 +174,21 @@ class PriceMonitor:
             # Add scheduled jobs
             self._setup_monitoring_jobs()
             
-            # Start the scheduler
+            # Start the scheduler for maintenance/metrics jobs and the
+            # check loop that drives price checks from the heap
             self.scheduler.start()
+
+            check_loop = self._scheduler_loop()
+            try:
+                self._scheduler_task = asyncio.ensure_future(check_loop)
+            except RuntimeError:
+                # No usable event loop (e.g. sync callers); the check
+                # loop can only run inside a running loop
+                check_loop.close()
+                logger.warning("No event loop available; price check loop not started")
+
             self.is_running = True
+            monitor_state.running = True
             
             logger.info("Price monitoring service started")
             
@@ -82,13 +203,24 @@ class PriceMonitor:
             return
         
         try:
-            # Shutdown scheduler
+            # Shutdown scheduler and the check loop
             self.scheduler.shutdown(wait=True)
-            
-            # Shutdown thread executor
-            self.executor.shutdown(wait=True)
-            
+
+            if self._scheduler_task:
+                self._scheduler_task.cancel()
+                self._scheduler_task = None
+
+            # Close the pooled SerpApi HTTP session
+            close_session = self.serpapi_client.aclose()
+            try:
+                asyncio.ensure_future(close_session)
+            except RuntimeError:
+                close_session.close()
+                asyncio.run(self.serpapi_client.aclose())
+
             self.is_running = False
+            monitor_state.running = False
+            monitor_state.next_check = None
             
             logger.info("Price monitoring service stopped")
             
@@ -99,35 +231,25 @@ class PriceMonitor:
         """Setup scheduled monitoring jobs based on product intervals"""
         # Get all active products and group by check interval
         with get_db_session() as session:
-            active_products = session.query(Product).filter(
+            active_products = session.query(Product).options(
+                load_only(*_SNAPSHOT_COLUMNS)
+            ).filter(
                 Product.is_active == True
             ).all()
-        
-        # Group products by interval
-        interval_groups = {}
+
+        # Snapshot products and seed the check heap: one loop wakes for
+        # the earliest due product instead of one scheduler job per
+        # distinct interval
+        now = time.time()
+        self._check_heap = []
         for product in active_products:
-            interval = product.check_interval
-            if interval not in interval_groups:
-                interval_groups[interval] = []
-            interval_groups[interval].append(product.id)
-        
-        # Create scheduled jobs for each interval
-        for interval, product_ids in interval_groups.items():
-            interval_seconds = get_interval_seconds(interval)
-            
-            # Add job to scheduler
-            self.scheduler.add_job(
-                func=self._check_products_batch,
-                trigger=IntervalTrigger(seconds=interval_seconds),
-                args=[product_ids],
-                id=f"price_check_{interval}",
-                name=f"Price check every {interval}",
-                max_instances=1,
-                coalesce=True,
-                misfire_grace_time=300  # 5 minutes grace time
-            )
-            
-            logger.info(f"Scheduled price checks every {interval} for {len(product_ids)} products")
+            self._product_cache[product.id] = _snapshot_product(product)
+            interval_seconds = get_interval_seconds(product.check_interval)
+            self._check_heap.append((now + interval_seconds, product.id))
+
+        heapq.heapify(self._check_heap)
+
+        logger.info(f"Scheduled price checks for {len(self._check_heap)} products")
         
         # Add maintenance job (runs daily)
         self.scheduler.add_job(
@@ -146,7 +268,67 @@ class PriceMonitor:
             name="Metrics collection",
             max_instances=1
         )
+
+        # Add incremental product sync so mutations reach the cache and
+        # heap without a full-table re-read
+        self._last_cache_sync = datetime.now(timezone.utc)
+        self.scheduler.add_job(
+            func=self._sync_product_changes,
+            trigger=IntervalTrigger(minutes=1),
+            id="product_change_sync",
+            name="Incremental product cache sync",
+            max_instances=1
+        )
     
+    async def _scheduler_loop(self):
+        """
+        Drive price checks from the due-time heap
+
+        Sleeps until the earliest product is due, drains everything due
+        within the batching window into one batch, and reschedules each
+        product at its own interval. Scheduling cost stays constant no
+        matter how many distinct intervals exist.
+        """
+        while True:
+            try:
+                if not self._check_heap:
+                    await asyncio.sleep(1.0)
+                    continue
+
+                due_ts = self._check_heap[0][0]
+                monitor_state.next_check = datetime.fromtimestamp(
+                    due_ts, tz=timezone.utc
+                )
+                now = time.time()
+                if due_ts > now:
+                    # Cap the sleep so newly added products are noticed
+                    await asyncio.sleep(min(due_ts - now, 60.0))
+                    continue
+
+                # Drain everything due within the batching window
+                due_ids = []
+                window_end = now + self._heap_window
+                while self._check_heap and self._check_heap[0][0] <= window_end:
+                    _, product_id = heapq.heappop(self._check_heap)
+                    snapshot = self._product_cache.get(product_id)
+                    if snapshot:
+                        interval_seconds = get_interval_seconds(snapshot.check_interval)
+                    else:
+                        # Not cached (e.g. invalidated after an update);
+                        # the batch path re-reads it from the database
+                        interval_seconds = get_interval_seconds(settings.default_check_interval)
+                    due_ids.append(product_id)
+                    heapq.heappush(self._check_heap, (now + interval_seconds, product_id))
+
+                if due_ids:
+                    asyncio.ensure_future(self._check_products_batch(due_ids))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in scheduler loop: {e}")
+                await asyncio.sleep(1.0)
+
     async def _check_products_batch(self, product_ids: List[str]):
         """
         Check prices for a batch of products
@@ -155,181 +337,442 @@ class PriceMonitor:
             product_ids: List of product IDs to check
         """
         start_time = time.time()
-        
+        # One timestamp for the whole batch: avoids thousands of clock
+        # reads and gives every record a consistent checked_at
+        batch_now = datetime.now(timezone.utc)
+
         try:
-            logger.info(f"Starting price check batch for {len(product_ids)} products")
-            
-            # Get products from database
-            with get_db_session() as session:
-                products = session.query(Product).filter(
-                    Product.id.in_(product_ids),
-                    Product.is_active == True
-                ).all()
+            logger.info("Starting price check batch for %d products", len(product_ids))
             
+            # Read products from the in-memory snapshot cache, falling
+            # back to the database for any not yet cached
+            products = [
+                self._product_cache[pid] for pid in product_ids
+                if pid in self._product_cache
+            ]
+            missing_ids = [pid for pid in product_ids if pid not in self._product_cache]
+
+            if missing_ids:
+                with get_db_session() as session:
+                    for product in session.query(Product).options(
+                        load_only(*_SNAPSHOT_COLUMNS)
+                    ).filter(
+                        Product.id.in_(missing_ids),
+                        Product.is_active == True
+                    ).all():
+                        snapshot = _snapshot_product(product)
+                        self._product_cache[product.id] = snapshot
+                        products.append(snapshot)
+
             if not products:
                 logger.warning("No active products found for batch check")
                 return
             
-            # Execute price checks concurrently
-            tasks = []
-            for product in products:
-                task = asyncio.create_task(self._check_single_product_async(product))
-                tasks.append(task)
-            
-            # Wait for all tasks to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
+            # Pipeline HTTP lookups into persist/alert waves through a
+            # queue so early results are written and alerted while the
+            # slowest requests are still in flight
+            semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+            results_q: asyncio.Queue = asyncio.Queue(maxsize=1024)
+
+            async def http_worker(product):
+                async with semaphore:
+                    try:
+                        result = await self._fetch_price_data(product)
+                    except Exception as e:
+                        # Surface per-product failures without cancelling
+                        # the rest of the batch
+                        result = e
+                await results_q.put((product, result))
+
             successful_checks = 0
             failed_checks = 0
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    failed_checks += 1
-                    logger.error(f"Price check failed for product {products[i].name}: {result}")
-                else:
-                    successful_checks += 1
-                    if result:  # Price record created
-                        # Check for alerts
-                        await self._check_price_alerts(products[i], result)
-            
+
+            async def alert_worker():
+                nonlocal successful_checks, failed_checks
+                remaining = len(products)
+                while remaining:
+                    wave = [await results_q.get()]
+                    remaining -= 1
+                    # Drain everything already finished so each wave
+                    # amortizes its transaction over several rows
+                    while remaining and not results_q.empty():
+                        wave.append(results_q.get_nowait())
+                        remaining -= 1
+
+                    checked_products = []
+                    for product, result in wave:
+                        if isinstance(result, Exception):
+                            failed_checks += 1
+                            logger.error("Price check failed for product %s: %s", product.name, result)
+                        else:
+                            successful_checks += 1
+                            if result:  # Price data found
+                                checked_products.append((product, result))
+
+                    if checked_products:
+                        await self._process_check_wave(checked_products, batch_now)
+
+            async with asyncio.TaskGroup() as task_group:
+                for product in products:
+                    task_group.create_task(http_worker(product))
+                task_group.create_task(alert_worker())
+
             # Update metrics
             self.metrics['checks_completed'] += successful_checks
             self.metrics['checks_failed'] += failed_checks
-            self.metrics['last_check_time'] = datetime.now(timezone.utc)
+            self.metrics['last_check_time'] = batch_now
             
             elapsed_time = time.time() - start_time
+            self._recent_durations.append(elapsed_time)
             self.metrics['average_check_time'] = (
-                self.metrics['average_check_time'] * 0.9 + elapsed_time * 0.1
+                sum(self._recent_durations) / len(self._recent_durations)
             )
             
             logger.info(
-                f"Batch price check completed: {successful_checks} successful, "
-                f"{failed_checks} failed in {elapsed_time:.2f}s"
+                "Batch price check completed: %d successful, %d failed in %.2fs",
+                successful_checks, failed_checks, elapsed_time
             )
             
         except Exception as e:
             logger.error(f"Error in batch price check: {e}")
-    
-    async def _check_single_product_async(self, product: Product) -> Optional[PriceHistory]:
+
+    async def _process_check_wave(
+        self,
+        checked_products: List[tuple],
+        batch_now: datetime
+    ):
         """
-        Async wrapper for single product price check
-        
+        Persist one wave of price results and send its alerts
+
         Args:
-            product: Product to check
-            
+            checked_products: (product, search_result) pairs from the HTTP workers
+            batch_now: Shared checked_at timestamp for the batch
+        """
+        # Previous prices come from the in-memory last-price map
+        # when possible; only products never seen by this process
+        # need the database lookup
+        previous_prices = {
+            product.id: self._last_prices[product.id]
+            for product, _ in checked_products
+            if product.id in self._last_prices
+        }
+        missing_price_ids = [
+            product.id for product, _ in checked_products
+            if product.id not in previous_prices
+        ]
+
+        # Run the read and write phases on one shared session so
+        # the wave holds a single pool connection
+        with shared_db_session():
+            if missing_price_ids:
+                previous_prices.update(
+                    self._fetch_previous_prices(missing_price_ids)
+                )
+
+            # Persist all price records and product updates in one
+            # transaction instead of one commit per product
+            price_records = self._persist_batch_results(checked_products, batch_now)
+
+        # Remember the just-written prices for the next interval
+        for price_record in price_records:
+            self._last_prices[price_record.product_id] = price_record.price
+
+        # Evaluate alerts for the whole wave, then fan the sends
+        # out together so notification round-trips overlap
+        alerts_to_send = []
+        for (product, _), price_record in zip(checked_products, price_records):
+            for alert_data in self._evaluate_price_alerts(
+                product, price_record,
+                previous_price=previous_prices.get(product.id)
+            ):
+                alerts_to_send.append((product, price_record, alert_data))
+
+        await self._send_price_alerts_bulk(alerts_to_send, batch_now)
+
+    async def _fetch_price_data(self, product: Union[Product, ProductSnapshot]) -> Optional[ProductResult]:
+        """
+        Look up current price data for a product via SerpAPI
+
+        Performs no database work, so batch checks can fan out lookups
+        and persist all results in one transaction afterwards.
+
+        Args:
+            product: Product to look up
+
         Returns:
-            PriceHistory record if successful, None otherwise
+            Processed product result if a price was found, None otherwise
         """
-        loop = asyncio.get_event_loop()
-        
         try:
-            # Run the synchronous price check in thread executor
-            price_record = await loop.run_in_executor(
-                self.executor,
-                self.check_single_product,
-                product
-            )
-            
-            return price_record
-            
-        except Exception as e:
-            logger.error(f"Async price check failed for {product.name}: {e}")
+            logger.debug("Checking price for: %s", product.name)
+
+            # Reuse a recent result for products sharing the same lookup
+            cache_key = (product.asin or product.search_query, product.max_price)
+            async with self._search_cache_lock:
+                search_result = self._search_cache.get(cache_key)
+
+            if search_result is None:
+                # Search for product using SerpAPI
+                if product.asin:
+                    # If we have ASIN, search by ASIN for accuracy
+                    search_result = await self.serpapi_client.get_product_by_asin_async(product.asin)
+                else:
+                    # Search by query and find best match
+                    search_result = await self.serpapi_client.get_best_price_match_async(
+                        search_query=product.search_query,
+                        max_price=product.max_price
+                    )
+
+                if search_result:
+                    async with self._search_cache_lock:
+                        self._search_cache[cache_key] = search_result
+
+            if not search_result:
+                logger.warning("No search results found for product: %s", product.name)
+                return None
+
+            # Extract price information
+            if not search_result.extracted_price:
+                logger.warning("No price found for product: %s", product.name)
+                return None
+
+            return search_result
+
+        except SerpApiError as e:
+            logger.error("SerpAPI error checking %s: %s", product.name, e)
             return None
-    
-    def check_single_product(self, product: Product) -> Optional[PriceHistory]:
+
+    def _build_price_row(
+        self,
+        product: Union[Product, ProductSnapshot],
+        search_result: ProductResult,
+        checked_at: datetime
+    ) -> Dict[str, Any]:
+        """Build a PriceHistory column dict from a search result"""
+        # Compress the raw API payload so retention-scale row volume
+        # does not bloat the table; falls back to plain text when
+        # zstandard is unavailable
+        raw_data = search_result.raw_data
+        raw_data_zst = None
+        if raw_data and _compress_raw_data is not None:
+            raw_data_zst = _compress_raw_data(raw_data)
+            raw_data = None
+
+        return {
+            'product_id': product.id,
+            'price': search_result.extracted_price,
+            'old_price': search_result.extracted_old_price,
+            'price_unit': search_result.price_unit,
+            'extracted_price_unit': search_result.extracted_price_unit,
+            'title': search_result.title,
+            'rating': search_result.rating,
+            'reviews_count': search_result.reviews_count,
+            'availability': search_result.availability,
+            'is_deal': search_result.is_deal,
+            'discount_percentage': search_result.discount_percentage,
+            'savings_amount': search_result.savings_amount,
+            'prime_eligible': search_result.prime_eligible,
+            'checked_at': checked_at,
+            'raw_data': raw_data,
+            'raw_data_zst': raw_data_zst
+        }
+
+    def _build_price_record(
+        self,
+        product: Union[Product, ProductSnapshot],
+        search_result: ProductResult,
+        checked_at: datetime
+    ) -> PriceHistory:
+        """Construct an ORM PriceHistory row from a search result"""
+        return PriceHistory(**self._build_price_row(product, search_result, checked_at))
+
+    @staticmethod
+    def _apply_product_metadata(
+        product_obj: Product,
+        search_result: ProductResult,
+        checked_at: datetime
+    ):
+        """Backfill product metadata discovered during a price check"""
+        product_obj.last_checked_at = checked_at
+
+        # Update ASIN if we found one
+        if not product_obj.asin and search_result.asin:
+            product_obj.asin = search_result.asin
+
+        # Update image URL if we found one
+        if not product_obj.image_url and search_result.image_url:
+            product_obj.image_url = search_result.image_url
+
+        # Update Amazon URL if we found one
+        if not product_obj.amazon_url and search_result.link:
+            product_obj.amazon_url = search_result.link
+
+    def _persist_batch_results(
+        self,
+        checked_products: List[tuple],
+        batch_now: datetime
+    ) -> List[PriceCheckResult]:
+        """
+        Write a batch of price checks in a single transaction
+
+        Rows are inserted through Core as plain dicts, skipping ORM
+        unit-of-work and identity-map bookkeeping on the hot write path.
+
+        Args:
+            checked_products: (product, search_result) pairs to persist
+            batch_now: Timestamp shared by every record in the batch
+
+        Returns:
+            Lightweight records for the prices that were written
+        """
+        if not checked_products:
+            return []
+
+        rows = [
+            self._build_price_row(product, search_result, batch_now)
+            for product, search_result in checked_products
+        ]
+
+        try:
+            with get_db_session() as session:
+                session.execute(insert(PriceHistory), rows)
+
+                # Apply all product metadata updates in the same transaction
+                product_ids = [p.id for p, _ in checked_products]
+                product_objs = {
+                    p.id: p for p in session.query(Product).filter(
+                        Product.id.in_(product_ids)
+                    ).all()
+                }
+                for product, search_result in checked_products:
+                    product_obj = product_objs.get(product.id)
+                    if product_obj:
+                        self._apply_product_metadata(
+                            product_obj, search_result, batch_now
+                        )
+
+                session.commit()
+
+        except Exception as e:
+            logger.error(f"Failed to persist batch price results: {e}")
+            return []
+
+        return [
+            PriceCheckResult(
+                product_id=row['product_id'],
+                price=row['price'],
+                old_price=row['old_price'],
+                title=row['title'],
+                rating=row['rating'],
+                reviews_count=row['reviews_count'],
+                is_deal=row['is_deal'],
+                discount_percentage=row['discount_percentage'],
+                savings_amount=row['savings_amount'],
+                prime_eligible=row['prime_eligible'],
+                checked_at=row['checked_at']
+            )
+            for row in rows
+        ]
+
+    async def check_single_product(self, product: Product) -> Optional[PriceHistory]:
         """
         Check price for a single product
-        
+
         Args:
             product: Product to check
-            
+
         Returns:
             PriceHistory record if successful, None otherwise
         """
         try:
-            logger.debug(f"Checking price for: {product.name}")
-            
-            # Search for product using SerpAPI
-            if product.asin:
-                # If we have ASIN, search by ASIN for accuracy
-                search_result = self.serpapi_client.get_product_by_asin(product.asin)
-            else:
-                # Search by query and find best match
-                search_result = self.serpapi_client.get_best_price_match(
-                    search_query=product.search_query,
-                    max_price=product.max_price
-                )
-            
+            search_result = await self._fetch_price_data(product)
             if not search_result:
-                logger.warning(f"No search results found for product: {product.name}")
                 return None
-            
-            # Extract price information
-            current_price = search_result.get('extracted_price')
-            if not current_price:
-                logger.warning(f"No price found for product: {product.name}")
-                return None
-            
+
             # Create price history record
             with get_db_session() as session:
-                price_record = PriceHistory(
-                    product_id=product.id,
-                    price=current_price,
-                    old_price=search_result.get('extracted_old_price'),
-                    price_unit=search_result.get('price_unit'),
-                    extracted_price_unit=search_result.get('extracted_price_unit'),
-                    title=search_result.get('title'),
-                    rating=search_result.get('rating'),
-                    reviews_count=search_result.get('reviews_count'),
-                    availability=search_result.get('availability'),
-                    is_deal=search_result.get('is_deal', False),
-                    discount_percentage=search_result.get('discount_percentage'),
-                    savings_amount=search_result.get('savings_amount'),
-                    prime_eligible=search_result.get('prime_eligible', False),
-                    checked_at=datetime.now(timezone.utc),
-                    raw_data=search_result.get('raw_data')
-                )
-                
+                checked_at = datetime.now(timezone.utc)
+                price_record = self._build_price_record(product, search_result, checked_at)
+
                 session.add(price_record)
-                
+
                 # Update product metadata
                 product_obj = session.query(Product).filter(Product.id == product.id).first()
                 if product_obj:
-                    product_obj.last_checked_at = datetime.now(timezone.utc)
-                    
-                    # Update ASIN if we found one
-                    if not product_obj.asin and search_result.get('asin'):
-                        product_obj.asin = search_result['asin']
-                    
-                    # Update image URL if we found one
-                    if not product_obj.image_url and search_result.get('image_url'):
-                        product_obj.image_url = search_result['image_url']
-                    
-                    # Update Amazon URL if we found one
-                    if not product_obj.amazon_url and search_result.get('link'):
-                        product_obj.amazon_url = search_result['link']
-                
+                    self._apply_product_metadata(product_obj, search_result, checked_at)
+
                 session.commit()
-                session.refresh(price_record)
-                
-                logger.info(f"Price check completed for {product.name}: ${current_price}")
+
+                logger.debug("Price check completed for %s: $%s", product.name, price_record.price)
                 return price_record
-                
+
         except SerpApiError as e:
-            logger.error(f"SerpAPI error checking {product.name}: {e}")
+            logger.error("SerpAPI error checking %s: %s", product.name, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error checking {product.name}: {e}")
+            logger.error("Unexpected error checking %s: %s", product.name, e)
             return None
-    
-    async def _check_price_alerts(self, product: Product, price_record: PriceHistory):
+
+    def _fetch_previous_prices(self, product_ids: List[str]) -> Dict[str, float]:
         """
-        Check if price alerts should be triggered
-        
+        Fetch the latest known price for each product in one query
+
+        Uses a window function so alert evaluation costs a single
+        round-trip for the whole batch instead of one query per product.
+
+        Args:
+            product_ids: Products to look up
+
+        Returns:
+            Mapping of product_id to its most recent recorded price
+        """
+        if not product_ids:
+            return {}
+
+        try:
+            with get_db_session() as session:
+                row_number = func.row_number().over(
+                    partition_by=PriceHistory.product_id,
+                    order_by=PriceHistory.checked_at.desc()
+                ).label('row_number')
+
+                latest = session.query(
+                    PriceHistory.product_id.label('product_id'),
+                    PriceHistory.price.label('price'),
+                    row_number
+                ).filter(
+                    PriceHistory.product_id.in_(product_ids)
+                ).subquery()
+
+                rows = session.query(
+                    latest.c.product_id, latest.c.price
+                ).filter(latest.c.row_number == 1).all()
+
+                return {product_id: price for product_id, price in rows}
+
+        except Exception as e:
+            logger.error(f"Failed to fetch previous prices: {e}")
+            return {}
+
+    def _evaluate_price_alerts(
+        self,
+        product: Union[Product, ProductSnapshot],
+        price_record: Union[PriceHistory, PriceCheckResult],
+        previous_price: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate which price alerts a check should trigger
+
+        Pure evaluation: the caller decides how to send the returned
+        alerts (individually or batched per channel).
+
         Args:
             product: Product that was checked
             price_record: Latest price record
+            previous_price: Last recorded price before this check, from
+                the batch-wide lookup (None if no prior history)
+
+        Returns:
+            Alert dictionaries ready for _send_price_alerts_bulk
         """
         try:
             current_price = price_record.price
@@ -360,139 +803,289 @@ class PriceMonitor:
                     }
                 })
             
-            # Check significant price drop
-            with get_db_session() as session:
-                # Get previous price record
-                previous_record = session.query(PriceHistory).filter(
-                    PriceHistory.product_id == product.id,
-                    PriceHistory.checked_at < price_record.checked_at
-                ).order_by(PriceHistory.checked_at.desc()).first()
-                
-                if previous_record:
-                    price_change_pct = ((previous_record.price - current_price) / previous_record.price) * 100
-                    
-                    if price_change_pct >= settings.price_change_threshold:
-                        alerts_to_send.append({
-                            'type': 'price_drop',
-                            'message': f"Significant price drop for {product.name}!",
-                            'details': {
-                                'current_price': current_price,
-                                'previous_price': previous_record.price,
-                                'price_change_percentage': price_change_pct,
-                                'savings': previous_record.price - current_price
-                            }
-                        })
+            # Check significant price drop against the previous price
+            # supplied by the batch-wide lookup
+            if previous_price:
+                price_change_pct = ((previous_price - current_price) / previous_price) * 100
+
+                if price_change_pct >= settings.price_change_threshold:
+                    alerts_to_send.append({
+                        'type': 'price_drop',
+                        'message': f"Significant price drop for {product.name}!",
+                        'details': {
+                            'current_price': current_price,
+                            'previous_price': previous_price,
+                            'price_change_percentage': price_change_pct,
+                            'savings': previous_price - current_price
+                        }
+                    })
             
-            # Send alerts
-            for alert_data in alerts_to_send:
-                await self._send_price_alert(product, price_record, alert_data)
-                
+            return alerts_to_send
+
         except Exception as e:
-            logger.error(f"Error checking price alerts for {product.name}: {e}")
+            logger.error("Error checking price alerts for %s: %s", product.name, e)
+            return []
     
-    async def _send_price_alert(
+    async def _notify_channels(
         self,
-        product: Product,
-        price_record: PriceHistory,
+        product: Union[Product, ProductSnapshot],
+        price_record: Union[PriceHistory, PriceCheckResult],
+        alert: PriceAlert,
         alert_data: Dict[str, Any]
-    ):
+    ) -> tuple:
         """
-        Send price alert notifications
-        
+        Send one alert over the product's enabled channels
+
         Args:
             product: Product for alert
             price_record: Price record that triggered alert
+            alert: Persisted alert record
             alert_data: Alert information
+
+        Returns:
+            (channels_used, notification_success) tuple
         """
+        notification_data = {
+            'product': product,
+            'price_record': price_record,
+            'alert': alert,
+            'alert_data': alert_data
+        }
+
+        notification_success = True
+        channels_used = []
+
+        if product.email_notifications:
+            try:
+                await self.notification_manager.send_email_alert(notification_data)
+                channels_used.append('email')
+            except Exception as e:
+                logger.error(f"Failed to send email alert: {e}")
+                notification_success = False
+
+        if product.slack_notifications:
+            try:
+                await self.notification_manager.send_slack_alert(notification_data)
+                channels_used.append('slack')
+            except Exception as e:
+                logger.error(f"Failed to send Slack alert: {e}")
+                notification_success = False
+
+        if product.desktop_notifications:
+            try:
+                await self.notification_manager.send_desktop_alert(notification_data)
+                channels_used.append('desktop')
+            except Exception as e:
+                logger.error(f"Failed to send desktop alert: {e}")
+                notification_success = False
+
+        return channels_used, notification_success
+
+    async def _send_price_alerts_bulk(
+        self,
+        alerts_to_send: List[tuple],
+        batch_now: Optional[datetime] = None
+    ):
+        """
+        Persist and send a batch of price alerts
+
+        Alert records are created in one transaction, channel sends for
+        all alerts run concurrently, and the delivery results are
+        written back in one more transaction.
+
+        Args:
+            alerts_to_send: (product, price_record, alert_data) tuples
+            batch_now: Timestamp shared by the whole batch
+        """
+        if not alerts_to_send:
+            return
+
+        if batch_now is None:
+            batch_now = datetime.now(timezone.utc)
+
         try:
-            # Create alert record
+            # Create all alert records in one transaction
+            alerts = []
             with get_db_session() as session:
-                alert = PriceAlert(
-                    product_id=product.id,
-                    alert_type=alert_data['type'],
-                    trigger_price=price_record.price,
-                    previous_price=alert_data['details'].get('previous_price'),
-                    savings_amount=alert_data['details'].get('savings', 0),
-                    notification_channels=[],
-                    notification_status='pending',
-                    created_at=datetime.now(timezone.utc)
-                )
-                
-                session.add(alert)
+                for product, price_record, alert_data in alerts_to_send:
+                    alerts.append(PriceAlert(
+                        product_id=product.id,
+                        alert_type=alert_data['type'],
+                        trigger_price=price_record.price,
+                        previous_price=alert_data['details'].get('previous_price'),
+                        savings_amount=alert_data['details'].get('savings', 0),
+                        notification_channels=[],
+                        notification_status='pending',
+                        created_at=batch_now
+                    ))
+
+                session.add_all(alerts)
                 session.commit()
-                session.refresh(alert)
-            
-            # Prepare notification data
-            notification_data = {
-                'product': product,
-                'price_record': price_record,
-                'alert': alert,
-                'alert_data': alert_data
-            }
-            
-            # Send notifications based on product settings
-            notification_success = True
-            channels_used = []
-            
-            if product.email_notifications:
-                try:
-                    await self.notification_manager.send_email_alert(notification_data)
-                    channels_used.append('email')
-                except Exception as e:
-                    logger.error(f"Failed to send email alert: {e}")
-                    notification_success = False
-            
-            if product.slack_notifications:
-                try:
-                    await self.notification_manager.send_slack_alert(notification_data)
-                    channels_used.append('slack')
-                except Exception as e:
-                    logger.error(f"Failed to send Slack alert: {e}")
-                    notification_success = False
-            
-            if product.desktop_notifications:
-                try:
-                    await self.notification_manager.send_desktop_alert(notification_data)
-                    channels_used.append('desktop')
-                except Exception as e:
-                    logger.error(f"Failed to send desktop alert: {e}")
-                    notification_success = False
-            
-            # Update alert record with results
+
+            # Fan out channel sends for all alerts concurrently
+            results = await asyncio.gather(*[
+                self._notify_channels(product, price_record, alert, alert_data)
+                for (product, price_record, alert_data), alert
+                in zip(alerts_to_send, alerts)
+            ], return_exceptions=True)
+
+            # Write all delivery results back in one transaction
             with get_db_session() as session:
-                alert_obj = session.query(PriceAlert).filter(PriceAlert.id == alert.id).first()
-                if alert_obj:
-                    alert_obj.notification_channels = channels_used
-                    alert_obj.notification_status = 'sent' if notification_success else 'failed'
-                    alert_obj.sent_at = datetime.now(timezone.utc) if notification_success else None
-                    session.commit()
-            
-            if notification_success:
-                self.metrics['alerts_sent'] += 1
-                logger.info(f"Alert sent for {product.name}: {alert_data['type']}")
-            else:
-                logger.error(f"Failed to send alert for {product.name}: {alert_data['type']}")
-                
+                for (product, _, alert_data), alert, result in zip(
+                    alerts_to_send, alerts, results
+                ):
+                    if isinstance(result, Exception):
+                        channels_used, notification_success = [], False
+                    else:
+                        channels_used, notification_success = result
+
+                    alert_obj = session.query(PriceAlert).filter(
+                        PriceAlert.id == alert.id
+                    ).first()
+                    if alert_obj:
+                        alert_obj.notification_channels = channels_used
+                        alert_obj.notification_status = 'sent' if notification_success else 'failed'
+                        alert_obj.sent_at = batch_now if notification_success else None
+
+                    if notification_success:
+                        self.metrics['alerts_sent'] += 1
+                        logger.debug("Alert sent for %s: %s", product.name, alert_data['type'])
+                    else:
+                        logger.error("Failed to send alert for %s: %s", product.name, alert_data['type'])
+
+                session.commit()
+
         except Exception as e:
-            logger.error(f"Error sending price alert for {product.name}: {e}")
+            logger.error(f"Error sending price alerts: {e}")
     
+    def invalidate_product(self, product_id: Optional[str] = None):
+        """
+        Drop cached product snapshots after a mutation
+
+        Args:
+            product_id: Product to invalidate, or None to clear the cache
+        """
+        if product_id is None:
+            self._product_cache.clear()
+            self._last_prices.clear()
+        else:
+            self._product_cache.pop(product_id, None)
+            self._last_prices.pop(product_id, None)
+
+    async def _sync_product_changes(self):
+        """
+        Incrementally sync product mutations into the cache and heap
+
+        Only rows touched since the last sync are read, so schedule
+        drift after an add/update/deactivate is bounded by one sync
+        interval without re-reading the whole products table.
+        """
+        try:
+            sync_started = datetime.now(timezone.utc)
+            with get_db_session() as session:
+                changed = session.query(Product).options(
+                    load_only(*_SNAPSHOT_COLUMNS, Product.is_active)
+                ).filter(
+                    Product.updated_at > self._last_cache_sync
+                ).all()
+
+            if changed:
+                scheduled = {product_id for _, product_id in self._check_heap}
+                now = time.time()
+                deactivated = set()
+                for product in changed:
+                    if product.is_active:
+                        self._product_cache[product.id] = _snapshot_product(product)
+                        if product.id not in scheduled:
+                            interval_seconds = get_interval_seconds(product.check_interval)
+                            heapq.heappush(
+                                self._check_heap, (now + interval_seconds, product.id)
+                            )
+                    else:
+                        deactivated.add(product.id)
+                        self._product_cache.pop(product.id, None)
+                        self._last_prices.pop(product.id, None)
+
+                if deactivated:
+                    self._check_heap = [
+                        entry for entry in self._check_heap
+                        if entry[1] not in deactivated
+                    ]
+                    heapq.heapify(self._check_heap)
+
+                logger.debug("Product cache sync applied %d changes", len(changed))
+
+            self._last_cache_sync = sync_started
+
+        except Exception as e:
+            logger.error(f"Error syncing product changes: {e}")
+
+    def _refresh_product_cache(self):
+        """Rebuild the product snapshot cache and prune the check heap"""
+        with get_db_session() as session:
+            active_products = session.query(Product).options(
+                load_only(*_SNAPSHOT_COLUMNS)
+            ).filter(
+                Product.is_active == True
+            ).all()
+
+        self._product_cache = {
+            product.id: _snapshot_product(product)
+            for product in active_products
+        }
+
+        # Drop deactivated products from the heap and schedule new ones
+        self._check_heap = [
+            entry for entry in self._check_heap
+            if entry[1] in self._product_cache
+        ]
+        heapq.heapify(self._check_heap)
+
+        scheduled = {product_id for _, product_id in self._check_heap}
+        now = time.time()
+        for product_id, snapshot in self._product_cache.items():
+            if product_id not in scheduled:
+                interval_seconds = get_interval_seconds(snapshot.check_interval)
+                heapq.heappush(self._check_heap, (now + interval_seconds, product_id))
+
     async def _maintenance_job(self):
         """Daily maintenance tasks"""
         try:
             logger.info("Running daily maintenance job")
+
+            # Refresh product snapshots so schedule and cache drift is
+            # bounded by one maintenance cycle
+            self._refresh_product_cache()
             
-            # Clean up old price history (keep last 90 days)
+            # Clean up old price history (keep last 90 days) in bounded
+            # chunks so one huge delete cannot hold the write lock or
+            # balloon the transaction log
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=90)
-            
-            with get_db_session() as session:
-                deleted_count = session.query(PriceHistory).filter(
-                    PriceHistory.checked_at < cutoff_date
-                ).delete()
-                
-                session.commit()
-                
-                if deleted_count > 0:
-                    logger.info(f"Cleaned up {deleted_count} old price history records")
+            deleted_count = 0
+
+            while True:
+                with get_db_session() as session:
+                    expired_ids = [
+                        row[0] for row in session.query(PriceHistory.id).filter(
+                            PriceHistory.checked_at < cutoff_date
+                        ).limit(self.CLEANUP_CHUNK_SIZE).all()
+                    ]
+
+                    if not expired_ids:
+                        break
+
+                    session.query(PriceHistory).filter(
+                        PriceHistory.id.in_(expired_ids)
+                    ).delete(synchronize_session=False)
+                    session.commit()
+
+                deleted_count += len(expired_ids)
+
+                # Yield between chunks so price checks keep flowing
+                await asyncio.sleep(0)
+
+            if deleted_count > 0:
+                logger.info(f"Cleaned up {deleted_count} old price history records")
             
             # Update product priorities based on activity
             await self._update_product_priorities()
@@ -535,5 +1128,6 @@ class PriceMonitor:
             'is_running': self.is_running,
             'scheduler_running': self.scheduler.running if self.scheduler else False,
             'jobs_count': len(self.scheduler.get_jobs()) if self.scheduler else 0,
+            'scheduled_products': len(self._check_heap),
             'metrics': self.get_metrics()
         }
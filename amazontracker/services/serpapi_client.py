@@ -3,15 +3,116 @@ SerpApi Client for Amazon Price Tracking
 Handles all interactions with the SerpApi service for Amazon product searches
 """
 
+import asyncio
+import math
+import re
+import threading
 import time
 import logging
+import httpx
+import numpy as np
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlencode
 import json
+from concurrent.futures import Future
+from dataclasses import dataclass, field, asdict
+from itertools import islice
+
+try:
+    import orjson
+
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
 
 logger = logging.getLogger(__name__)
 
+# Straight result-field to product-field copies used by
+# _process_product_result; one comprehension replaces a dict built
+# key-by-key with ~20 separate lookups
+_FIELD_MAP = (
+    ('position', 'position'),
+    ('asin', 'asin'),
+    ('title', 'title'),
+    ('image_url', 'thumbnail'),
+    ('price', 'price'),
+    ('extracted_price', 'extracted_price'),
+    ('old_price', 'old_price'),
+    ('extracted_old_price', 'extracted_old_price'),
+    ('price_unit', 'price_unit'),
+    ('extracted_price_unit', 'extracted_price_unit'),
+    ('rating', 'rating'),
+    ('reviews_count', 'reviews'),
+    ('availability', 'availability'),
+    ('shipping', 'shipping'),
+    ('options', 'options'),
+    ('seller', 'seller'),
+    ('bought_last_month', 'bought_last_month'),
+)
+
+
+@dataclass(slots=True)
+class ProductResult:
+    """
+    Processed Amazon product result
+
+    Slotted dataclass instead of a ~25-key dict: a fraction of the
+    per-product memory on large result sets, and attribute access is
+    cheaper than key lookups in the scoring loops.
+    """
+    position: Optional[int] = None
+    asin: Optional[str] = None
+    title: Optional[str] = None
+    link: Optional[str] = None
+    image_url: Optional[str] = None
+    price: Optional[str] = None
+    extracted_price: Optional[float] = None
+    old_price: Optional[str] = None
+    extracted_old_price: Optional[float] = None
+    price_unit: Optional[str] = None
+    extracted_price_unit: Optional[float] = None
+    rating: Optional[float] = None
+    reviews_count: Optional[int] = None
+    prime_eligible: bool = False
+    sponsored: bool = False
+    availability: Optional[str] = None
+    delivery: List[Any] = field(default_factory=list)
+    shipping: Optional[Any] = None
+    discount_percentage: Optional[float] = None
+    savings_amount: Optional[float] = None
+    is_deal: bool = False
+    tags: List[Any] = field(default_factory=list)
+    options: Optional[Any] = None
+    seller: Optional[Any] = None
+    bought_last_month: Optional[Any] = None
+    relevance_score: Optional[float] = None
+    # Reference to the raw API result, kept only on DEBUG runs
+    _raw: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    @property
+    def raw_data(self) -> Optional[str]:
+        """Raw API payload, serialized lazily on first access"""
+        return _dumps(self._raw) if self._raw is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view for JSON serialization"""
+        data = asdict(self)
+        data.pop('_raw', None)
+        data['raw_data'] = self.raw_data
+        return data
+
 
 class SerpApiError(Exception):
     """Custom exception for SerpApi related errors"""
@@ -23,6 +124,61 @@ class SerpApiRateLimitError(SerpApiError):
     pass
 
 
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by the sync and async request paths
+
+    Refills at a steady rate up to a burst capacity, so sparse calls go
+    through immediately while the long-run request rate stays capped.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens the bucket can hold (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Consume a token if available, else return seconds until one refills"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            logger.debug("Rate limiting: sleeping for %.2f seconds", wait)
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Await a token without blocking the event loop"""
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            logger.debug("Rate limiting: sleeping for %.2f seconds", wait)
+            await asyncio.sleep(wait)
+
+
 class SerpApiClient:
     """
     Client for interacting with SerpApi Amazon Search API
@@ -35,7 +191,9 @@ class SerpApiClient:
         api_key: str,
         timeout: int = 30,
         retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        requests_per_minute: int = 60,
+        burst_limit: int = 10
     ):
         """
         Initialize SerpApi client
@@ -45,17 +203,100 @@ class SerpApiClient:
             timeout: Request timeout in seconds
             retries: Number of retry attempts
             retry_delay: Delay between retries in seconds
+            requests_per_minute: Long-run request rate cap
+            burst_limit: Maximum burst of back-to-back requests
         """
         self.api_key = api_key
         self.timeout = timeout
         self.retries = retries
         self.retry_delay = retry_delay
-        
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 1.0  # Minimum 1 second between requests
-        
+
+        # Rate limiting: token bucket allows bursts up to burst_limit
+        # while capping the sustained rate at requests_per_minute
+        self._bucket = TokenBucket(
+            rate=requests_per_minute / 60.0,
+            capacity=burst_limit
+        )
+
+        # TTL caches: repeated lookups inside the window skip the HTTP
+        # round-trip entirely (each SerpApi call costs money as well as
+        # latency). ASIN lookups are stable, searches less so
+        self._asin_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._search_cache = TTLCache(maxsize=256, ttl=300)
+        self._cache_lock = threading.RLock()
+        self.cache_stats = {'hits': 0, 'misses': 0}
+
+        # Single-flight guards: concurrent identical ASIN lookups share
+        # one HTTP call instead of stampeding past the cache. These are
+        # concurrent.futures.Future, not asyncio.Future, so sync and
+        # async callers on any event loop can join the same flight
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Pooled HTTP session: keep-alive reuses the TLS connection to
+        # serpapi.com instead of handshaking on every request. Retries
+        # live on the adapter so urllib3 handles backoff with jitter,
+        # honors Retry-After on 429s, and reuses the socket between
+        # attempts
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=retry_delay,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        ))
+        self._session.headers.update({
+            'User-Agent': 'AmazonPriceTracker/1.0',
+            'Accept': 'application/json',
+            # Advertise compression explicitly; JSON result sets shrink
+            # several-fold and requests decompresses transparently
+            'Accept-Encoding': 'gzip, deflate'
+        })
+
+        # Shared async HTTP client, created lazily on first async request
+        # so construction does not require a running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+
         logger.info("SerpApi client initialized")
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the shared async HTTP client, creating a pooled one if needed"""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=75.0
+                ),
+                headers={
+                    'User-Agent': 'AmazonPriceTracker/1.0',
+                    'Accept': 'application/json',
+                    'Accept-Encoding': 'gzip, deflate'
+                }
+            )
+        return self._async_client
+
+    async def aclose(self):
+        """Close the shared async HTTP client"""
+        if self._async_client and not self._async_client.is_closed:
+            await self._async_client.aclose()
+
+    def close(self):
+        """Release pooled HTTP connections"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def search_amazon_products(
         self,
@@ -84,6 +325,18 @@ class SerpApiClient:
             SerpApiError: If API request fails
             SerpApiRateLimitError: If rate limit is exceeded
         """
+        cache_key = (
+            query, amazon_domain, language, sort_by, max_results,
+            tuple(sorted(kwargs.items()))
+        )
+        with self._cache_lock:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                self.cache_stats['hits'] += 1
+                logger.debug("Search cache hit for '%s'", query)
+                return cached
+            self.cache_stats['misses'] += 1
+
         params = {
             "engine": "amazon",
             "k": query,
@@ -93,19 +346,22 @@ class SerpApiClient:
             "s": sort_by,
             **kwargs
         }
-        
+
         try:
             response_data = self._make_request(params)
-            
+
             # Extract and process results
             results = self._process_search_results(response_data, max_results)
-            
-            logger.info(f"Successfully searched for '{query}' - found {len(results.get('products', []))} products")
-            
+
+            logger.info("Successfully searched for '%s' - found %d products", query, len(results.get('products', [])))
+
+            with self._cache_lock:
+                self._search_cache[cache_key] = results
+
             return results
-            
+
         except Exception as e:
-            logger.error(f"Failed to search Amazon products for query '{query}': {e}")
+            logger.error("Failed to search Amazon products for query '%s': %s", query, e)
             raise SerpApiError(f"Amazon search failed: {e}")
     
     def get_product_by_asin(
@@ -113,7 +369,7 @@ class SerpApiClient:
         asin: str,
         amazon_domain: str = "amazon.com",
         language: str = "en_US"
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[ProductResult]:
         """
         Get specific product information by ASIN
         
@@ -125,6 +381,31 @@ class SerpApiClient:
         Returns:
             Product information dictionary or None if not found
         """
+        cache_key = (asin, amazon_domain, language)
+        with self._cache_lock:
+            cached = self._asin_cache.get(cache_key)
+            if cached is not None:
+                self.cache_stats['hits'] += 1
+                logger.debug("ASIN cache hit for %s", asin)
+                return cached
+            self.cache_stats['misses'] += 1
+
+        # Single-flight: if an identical lookup is already on the wire,
+        # wait for its result instead of issuing a duplicate request
+        with self._inflight_lock:
+            fut = self._inflight.get(cache_key)
+            if fut is None:
+                fut = Future()
+                self._inflight[cache_key] = fut
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            logger.debug("Joining in-flight lookup for ASIN %s", asin)
+            return fut.result(timeout=self.timeout)
+
+        product = None
         try:
             # Search by ASIN is typically done with a specific query format
             query = f"asin:{asin}"
@@ -134,17 +415,24 @@ class SerpApiClient:
                 language=language,
                 max_results=1
             )
-            
+
             products = results.get('products', [])
             if products:
-                return products[0]
-            
-            logger.warning(f"No product found for ASIN: {asin}")
-            return None
-            
+                product = products[0]
+                with self._cache_lock:
+                    self._asin_cache[cache_key] = product
+            else:
+                logger.warning("No product found for ASIN: %s", asin)
+            return product
+
         except Exception as e:
-            logger.error(f"Failed to get product by ASIN {asin}: {e}")
+            logger.error("Failed to get product by ASIN %s: %s", asin, e)
             return None
+
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            fut.set_result(product)
     
     def get_best_price_match(
         self,
@@ -153,7 +441,7 @@ class SerpApiClient:
         max_price: float = None,
         min_rating: float = None,
         amazon_domain: str = "amazon.com"
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[ProductResult]:
         """
         Find the best price match for a search query with optional filters
         
@@ -176,52 +464,297 @@ class SerpApiClient:
                 max_results=50
             )
             
-            products = results.get('products', [])
-            
-            # Filter products based on criteria
-            filtered_products = []
-            
-            for product in products:
-                # Check if product has required information
-                if not product.get('extracted_price'):
-                    continue
-                
-                price = product['extracted_price']
-                rating = product.get('rating', 0)
-                title = product.get('title', '').lower()
-                
-                # Apply filters
-                if max_price and price > max_price:
-                    continue
-                
-                if min_rating and rating < min_rating:
+            return self._select_best_match(
+                results.get('products', []),
+                search_query=search_query,
+                target_keywords=target_keywords,
+                max_price=max_price,
+                min_rating=min_rating
+            )
+
+        except Exception as e:
+            logger.error("Failed to find best price match for '%s': %s", search_query, e)
+            return None
+
+    def _select_best_match(
+        self,
+        products: List[ProductResult],
+        search_query: str,
+        target_keywords: List[str] = None,
+        max_price: float = None,
+        min_rating: float = None
+    ) -> Optional[ProductResult]:
+        """
+        Filter products by criteria and pick the most relevant match
+
+        Args:
+            products: Processed product results
+            search_query: Original search query
+            target_keywords: Keywords that must be in product title
+            max_price: Maximum acceptable price
+            min_rating: Minimum product rating
+
+        Returns:
+            Best matching product or None
+        """
+        # Filter products based on criteria. Hoist per-call work out of
+        # the loop: keywords are lowercased once instead of per product
+        lowered_keywords = (
+            tuple(keyword.lower() for keyword in target_keywords)
+            if target_keywords else None
+        )
+        # One compiled alternation scans each title in a single pass
+        # instead of one substring walk per keyword. Longest keywords
+        # first so a shorter prefix alternative cannot shadow a longer
+        # keyword at the same position
+        if lowered_keywords:
+            keyword_pattern = re.compile('|'.join(
+                re.escape(keyword)
+                for keyword in sorted(set(lowered_keywords), key=len, reverse=True)
+            ))
+            required_matches = len(set(lowered_keywords))
+        else:
+            keyword_pattern = None
+            required_matches = 0
+        has_max_price = max_price is not None
+        has_min_rating = min_rating is not None
+
+        filtered_products = []
+
+        for product in products:
+            # Check if product has required information
+            if not product.extracted_price:
+                continue
+
+            price = product.extracted_price
+            rating = product.rating or 0
+            title = (product.title or '').lower()
+
+            # Apply filters
+            if has_max_price and price > max_price:
+                continue
+
+            if has_min_rating and rating < min_rating:
+                continue
+
+            if keyword_pattern:
+                matched = set(keyword_pattern.findall(title))
+                if len(matched) != required_matches:
                     continue
-                
-                if target_keywords:
-                    if not all(keyword.lower() in title for keyword in target_keywords):
-                        continue
-                
-                # Calculate relevance score
-                relevance_score = self._calculate_relevance_score(product, search_query)
-                product['relevance_score'] = relevance_score
-                
-                filtered_products.append(product)
-            
-            if not filtered_products:
-                logger.info(f"No products match criteria for query: {search_query}")
-                return None
-            
-            # Sort by relevance score and return best match
-            best_match = max(filtered_products, key=lambda p: p['relevance_score'])
-            
-            logger.info(f"Found best match for '{search_query}': {best_match.get('title')} - ${best_match.get('extracted_price')}")
-            
-            return best_match
-            
+
+            filtered_products.append(product)
+
+        if not filtered_products:
+            logger.info("No products match criteria for query: %s", search_query)
+            return None
+
+        # Score all survivors in one vectorized pass and keep the best;
+        # the query is tokenized once here rather than per product
+        query_words = tuple(search_query.lower().split())
+        scores = self._calculate_relevance_scores(filtered_products, query_words)
+        for product, score in zip(filtered_products, scores):
+            product.relevance_score = float(score)
+
+        best_match = filtered_products[int(scores.argmax())]
+
+        logger.info("Found best match for '%s': %s - $%s", search_query, best_match.title, best_match.extracted_price)
+
+        return best_match
+
+    async def search_amazon_products_async(
+        self,
+        query: str,
+        amazon_domain: str = "amazon.com",
+        language: str = "en_US",
+        sort_by: str = "relevanceblender",
+        max_results: int = 20,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async variant of search_amazon_products using the shared HTTP client
+
+        Args:
+            query: Search query for products
+            amazon_domain: Amazon domain to search
+            language: Language for search results
+            sort_by: Sorting method for results
+            max_results: Maximum number of results to return
+            **kwargs: Additional search parameters
+
+        Returns:
+            Dict containing search results and metadata
+
+        Raises:
+            SerpApiError: If API request fails
+            SerpApiRateLimitError: If rate limit is exceeded
+        """
+        params = {
+            "engine": "amazon",
+            "k": query,
+            "amazon_domain": amazon_domain,
+            "language": language,
+            "api_key": self.api_key,
+            "s": sort_by,
+            **kwargs
+        }
+
+        try:
+            response_data = await self._make_request_async(params)
+
+            # Extract and process results
+            results = self._process_search_results(response_data, max_results)
+
+            logger.info("Successfully searched for '%s' - found %d products", query, len(results.get('products', [])))
+
+            return results
+
         except Exception as e:
-            logger.error(f"Failed to find best price match for '{search_query}': {e}")
+            logger.error("Failed to search Amazon products for query '%s': %s", query, e)
+            raise SerpApiError(f"Amazon search failed: {e}")
+
+    async def get_product_by_asin_async(
+        self,
+        asin: str,
+        amazon_domain: str = "amazon.com",
+        language: str = "en_US"
+    ) -> Optional[ProductResult]:
+        """
+        Async variant of get_product_by_asin
+
+        Args:
+            asin: Amazon Standard Identification Number
+            amazon_domain: Amazon domain
+            language: Language for results
+
+        Returns:
+            Product information dictionary or None if not found
+        """
+        cache_key = (asin, amazon_domain, language)
+        with self._cache_lock:
+            cached = self._asin_cache.get(cache_key)
+            if cached is not None:
+                self.cache_stats['hits'] += 1
+                logger.debug("ASIN cache hit for %s", asin)
+                return cached
+            self.cache_stats['misses'] += 1
+
+        # Single-flight over the same loop-agnostic futures the sync
+        # path uses: callers may sit on different event loops (each
+        # to_thread check runs its own), so an asyncio.Future keyed
+        # here would raise "attached to a different loop" for joiners
+        with self._inflight_lock:
+            fut = self._inflight.get(cache_key)
+            if fut is None:
+                fut = Future()
+                self._inflight[cache_key] = fut
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            logger.debug("Joining in-flight lookup for ASIN %s", asin)
+            return await asyncio.wrap_future(fut)
+
+        product = None
+        try:
+            query = f"asin:{asin}"
+            results = await self.search_amazon_products_async(
+                query=query,
+                amazon_domain=amazon_domain,
+                language=language,
+                max_results=1
+            )
+
+            products = results.get('products', [])
+            if products:
+                product = products[0]
+                with self._cache_lock:
+                    self._asin_cache[cache_key] = product
+            else:
+                logger.warning("No product found for ASIN: %s", asin)
+            return product
+
+        except Exception as e:
+            logger.error("Failed to get product by ASIN %s: %s", asin, e)
             return None
-    
+
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            fut.set_result(product)
+
+    async def get_best_price_match_async(
+        self,
+        search_query: str,
+        target_keywords: List[str] = None,
+        max_price: float = None,
+        min_rating: float = None,
+        amazon_domain: str = "amazon.com"
+    ) -> Optional[ProductResult]:
+        """
+        Async variant of get_best_price_match
+
+        Args:
+            search_query: Product search query
+            target_keywords: Keywords that must be in product title
+            max_price: Maximum acceptable price
+            min_rating: Minimum product rating
+            amazon_domain: Amazon domain to search
+
+        Returns:
+            Best matching product or None
+        """
+        try:
+            results = await self.search_amazon_products_async(
+                query=search_query,
+                amazon_domain=amazon_domain,
+                sort_by="price-asc-rank",  # Sort by price low to high
+                max_results=50
+            )
+
+            return self._select_best_match(
+                results.get('products', []),
+                search_query=search_query,
+                target_keywords=target_keywords,
+                max_price=max_price,
+                min_rating=min_rating
+            )
+
+        except Exception as e:
+            logger.error("Failed to find best price match for '%s': %s", search_query, e)
+            return None
+
+    async def get_many_by_asin(
+        self,
+        asins: List[str],
+        amazon_domain: str = "amazon.com",
+        language: str = "en_US",
+        concurrency: int = 10
+    ) -> List[Optional[ProductResult]]:
+        """
+        Look up many ASINs concurrently over the shared HTTP client
+
+        Args:
+            asins: ASINs to look up
+            amazon_domain: Amazon domain
+            language: Language for results
+            concurrency: Maximum lookups in flight at once
+
+        Returns:
+            Product dictionaries in the same order as asins, None for misses
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_lookup(asin: str) -> Optional[ProductResult]:
+            async with semaphore:
+                return await self.get_product_by_asin_async(
+                    asin,
+                    amazon_domain=amazon_domain,
+                    language=language
+                )
+
+        return await asyncio.gather(*[bounded_lookup(asin) for asin in asins])
+
     def get_price_history_simulation(
         self,
         asin: str,
@@ -248,89 +781,141 @@ class SerpApiClient:
         # Return current price as single data point
         return [{
             'date': time.strftime('%Y-%m-%d'),
-            'price': current_product.get('extracted_price'),
-            'title': current_product.get('title'),
-            'rating': current_product.get('rating'),
-            'reviews': current_product.get('reviews')
+            'price': current_product.extracted_price,
+            'title': current_product.title,
+            'rating': current_product.rating,
+            'reviews': current_product.reviews_count
         }]
     
     def _make_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Make HTTP request to SerpApi with rate limiting and retry logic
-        
+        Make HTTP request to SerpApi with rate limiting
+
+        Retries are handled by the urllib3 Retry policy mounted on the
+        session adapter, so a single get() here already covers backoff
+        and Retry-After handling.
+
         Args:
             params: Request parameters
-            
+
         Returns:
             API response data
-            
+
         Raises:
             SerpApiError: If request fails after retries
             SerpApiRateLimitError: If rate limited
         """
         # Rate limiting
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        
-        url = self.BASE_URL
-        
+        self._bucket.acquire()
+
+        try:
+            logger.debug("Making SerpApi request: %s", params.get('k', 'N/A'))
+
+            response = self._session.get(
+                self.BASE_URL,
+                params=params,
+                timeout=self.timeout
+            )
+
+            # Check response status (after adapter-level retries)
+            if response.status_code == 429:
+                logger.warning("Rate limit exceeded")
+                raise SerpApiRateLimitError("Rate limit exceeded")
+
+            response.raise_for_status()
+
+            # Parse JSON response (orjson skips the encoding
+            # re-detection response.json() would do)
+            data = _loads(response.content)
+
+            # Check for API errors
+            if 'error' in data:
+                error_msg = data['error']
+                logger.error("SerpAPI error: %s", error_msg)
+                raise SerpApiError(f"API error: {error_msg}")
+
+            # Log usage information
+            search_metadata = data.get('search_metadata', {})
+            logger.debug("Request successful - ID: %s", search_metadata.get('id', 'N/A'))
+
+            return data
+
+        except SerpApiError:
+            raise
+
+        except requests.exceptions.RequestException as e:
+            raise SerpApiError(f"Request failed after {self.retries + 1} attempts: {e}")
+
+        except Exception as e:
+            logger.error("Unexpected error during request: %s", e)
+            raise SerpApiError(f"Unexpected error: {e}")
+    
+    async def _make_request_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async HTTP request to SerpApi with rate limiting and retry logic
+
+        Runs on the event loop via the shared pooled client, so batch
+        checks fan out concurrently instead of tying up worker threads.
+
+        Args:
+            params: Request parameters
+
+        Returns:
+            API response data
+
+        Raises:
+            SerpApiError: If request fails after retries
+            SerpApiRateLimitError: If rate limited
+        """
+        # Rate limiting
+        await self._bucket.acquire_async()
+
+        client = self._get_async_client()
+
         for attempt in range(self.retries + 1):
             try:
-                logger.debug(f"Making SerpApi request (attempt {attempt + 1}): {params.get('k', 'N/A')}")
-                
-                response = requests.get(
-                    url,
-                    params=params,
-                    timeout=self.timeout,
-                    headers={
-                        'User-Agent': 'AmazonPriceTracker/1.0',
-                        'Accept': 'application/json'
-                    }
-                )
-                
-                self.last_request_time = time.time()
-                
+                logger.debug("Making SerpApi request (attempt %d): %s", attempt + 1, params.get('k', 'N/A'))
+
+                response = await client.get(self.BASE_URL, params=params)
+
+
                 # Check response status
                 if response.status_code == 429:
                     logger.warning("Rate limit exceeded")
                     raise SerpApiRateLimitError("Rate limit exceeded")
-                
+
                 response.raise_for_status()
-                
-                # Parse JSON response
-                data = response.json()
-                
+
+                # Parse JSON response (orjson skips the encoding
+                # re-detection response.json() would do)
+                data = _loads(response.content)
+
                 # Check for API errors
                 if 'error' in data:
                     error_msg = data['error']
-                    logger.error(f"SerpAPI error: {error_msg}")
+                    logger.error("SerpAPI error: %s", error_msg)
                     raise SerpApiError(f"API error: {error_msg}")
-                
+
                 # Log usage information
                 search_metadata = data.get('search_metadata', {})
-                logger.debug(f"Request successful - ID: {search_metadata.get('id', 'N/A')}")
-                
+                logger.debug("Request successful - ID: %s", search_metadata.get('id', 'N/A'))
+
                 return data
-                
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request attempt {attempt + 1} failed: {e}")
-                
+
+            except httpx.HTTPError as e:
+                logger.warning("Request attempt %d failed: %s", attempt + 1, e)
+
                 if attempt < self.retries:
                     sleep_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.info(f"Retrying in {sleep_time} seconds...")
-                    time.sleep(sleep_time)
+                    logger.info("Retrying in %s seconds...", sleep_time)
+                    await asyncio.sleep(sleep_time)
                 else:
                     raise SerpApiError(f"Request failed after {self.retries + 1} attempts: {e}")
-            
+
             except Exception as e:
-                logger.error(f"Unexpected error during request: {e}")
+                logger.error("Unexpected error during request: %s", e)
                 raise SerpApiError(f"Unexpected error: {e}")
-    
+
     def _process_search_results(
         self,
         raw_data: Dict[str, Any],
@@ -358,13 +943,16 @@ class SerpApiClient:
         
         # Extract organic results
         organic_results = raw_data.get('organic_results', [])
-        
-        # Process each product
-        for i, result in enumerate(organic_results[:max_results]):
-            processed_product = self._process_product_result(result)
-            if processed_product:
-                processed_results['products'].append(processed_product)
-        
+
+        # Keep processing until max_results valid products are found:
+        # priceless results no longer count against the requested size,
+        # and trailing results that cannot make the cut are never built
+        processed_iter = filter(
+            None,
+            (self._process_product_result(result) for result in organic_results)
+        )
+        processed_results['products'] = list(islice(processed_iter, max_results))
+
         processed_results['total_results'] = len(processed_results['products'])
         
         return processed_results
@@ -380,116 +968,145 @@ class SerpApiClient:
             Processed product data or None if invalid
         """
         try:
-            # Extract core product information
-            product = {
-                'position': result.get('position'),
-                'asin': result.get('asin'),
-                'title': result.get('title'),
-                'link': result.get('link_clean', result.get('link')),
-                'image_url': result.get('thumbnail'),
-                
-                # Price information
-                'price': result.get('price'),
-                'extracted_price': result.get('extracted_price'),
-                'old_price': result.get('old_price'),
-                'extracted_old_price': result.get('extracted_old_price'),
-                'price_unit': result.get('price_unit'),
-                'extracted_price_unit': result.get('extracted_price_unit'),
-                
-                # Product details
-                'rating': result.get('rating'),
-                'reviews_count': result.get('reviews'),
-                'prime_eligible': result.get('prime', False),
-                'sponsored': result.get('sponsored', False),
-                
-                # Availability and shipping
-                'availability': result.get('availability'),
-                'delivery': result.get('delivery', []),
-                'shipping': result.get('shipping'),
-                
-                # Deal information
-                'discount_percentage': None,
-                'savings_amount': None,
-                'is_deal': False,
-                
-                # Additional metadata
-                'tags': result.get('tags', []),
-                'options': result.get('options'),
-                'seller': result.get('seller'),
-                'bought_last_month': result.get('bought_last_month'),
-                
-                # Raw data for debugging
-                'raw_data': json.dumps(result) if logger.isEnabledFor(logging.DEBUG) else None
-            }
-            
-            # Calculate deal information
-            if product['extracted_price'] and product['extracted_old_price']:
-                old_price = product['extracted_old_price']
-                current_price = product['extracted_price']
-                
-                if old_price > current_price:
-                    savings = old_price - current_price
-                    discount_pct = (savings / old_price) * 100
-                    
-                    product['savings_amount'] = savings
-                    product['discount_percentage'] = round(discount_pct, 2)
-                    product['is_deal'] = discount_pct >= 5.0  # Consider 5%+ a deal
-            
-            # Validate required fields
-            if not product['extracted_price']:
-                logger.debug(f"Skipping product without price: {product.get('title', 'Unknown')}")
+            # Hoist the prices once up front; the deal block and the
+            # validation below reuse the locals instead of re-reading
+            # the product
+            extracted_price = result.get('extracted_price')
+            extracted_old_price = result.get('extracted_old_price')
+
+            # Validate required fields before doing any other work
+            if not extracted_price:
+                logger.debug("Skipping product without price: %s", result.get('title') or 'Unknown')
                 return None
-            
+
+            # Extract core product information via the field table; the
+            # remaining fields need defaults or fallbacks
+            product = ProductResult(**{dst: result.get(src) for dst, src in _FIELD_MAP})
+            product.link = result.get('link_clean') or result.get('link')
+            product.prime_eligible = result.get('prime', False)
+            product.sponsored = result.get('sponsored', False)
+            product.delivery = result.get('delivery', [])
+            product.tags = result.get('tags', [])
+
+            # Raw data for debugging: keep a reference and let the
+            # raw_data property serialize it only if someone reads it
+            product._raw = result if logger.isEnabledFor(logging.DEBUG) else None
+
+            # Calculate deal information
+            if extracted_old_price and extracted_old_price > extracted_price:
+                savings = extracted_old_price - extracted_price
+                discount_pct = (savings / extracted_old_price) * 100
+
+                product.savings_amount = savings
+                product.discount_percentage = round(discount_pct, 2)
+                product.is_deal = discount_pct >= 5.0  # Consider 5%+ a deal
+
             return product
             
         except Exception as e:
-            logger.warning(f"Failed to process product result: {e}")
+            logger.warning("Failed to process product result: %s", e)
             return None
     
-    def _calculate_relevance_score(
+    def _calculate_relevance_scores(
         self,
-        product: Dict[str, Any],
-        search_query: str
+        products: List[ProductResult],
+        query_words: tuple
+    ) -> np.ndarray:
+        """
+        Vectorized relevance scoring over many products at once
+
+        Applies the same weighting as _calculate_relevance_score but
+        builds NumPy arrays over the whole candidate list instead of
+        scoring each product in a separate Python call.
+
+        Args:
+            products: Candidate product results
+            query_words: Pre-tokenized, lowercased query words
+
+        Returns:
+            Array of relevance scores aligned with products
+        """
+        # Token-set intersection instead of per-word substring scans;
+        # a tokenless query contributes a flat zero title score
+        qset = frozenset(query_words)
+        if qset:
+            title_matches = np.array([
+                len(qset & set((product.title or '').lower().split()))
+                for product in products
+            ], dtype=np.float32)
+        else:
+            title_matches = np.zeros(len(products), dtype=np.float32)
+        ratings = np.array(
+            [product.rating or 0 for product in products],
+            dtype=np.float32
+        )
+        reviews = np.array(
+            [product.reviews_count or 0 for product in products],
+            dtype=np.float32
+        )
+        primes = np.array(
+            [bool(product.prime_eligible) for product in products],
+            dtype=np.float32
+        )
+        discounts = np.array([
+            (product.discount_percentage or 0) if product.is_deal else 0
+            for product in products
+        ], dtype=np.float32)
+
+        scores = (
+            title_matches / max(len(qset), 1) * 0.4
+            + ratings / 5.0 * 0.2
+            + np.clip(np.log10(np.maximum(reviews, 1.0)) / 3.0, 0.0, 1.0) * 0.15
+            + primes * 0.1
+            + np.clip(discounts / 50.0, 0.0, 1.0) * 0.15
+        )
+
+        return np.minimum(scores, 1.0)  # Cap at 1.0
+
+    @staticmethod
+    def _calculate_relevance_score(
+        product: ProductResult,
+        query_words: tuple
     ) -> float:
         """
-        Calculate relevance score for a product based on search query
-        
+        Calculate relevance score for a single product
+
         Args:
             product: Product data
-            search_query: Original search query
-            
+            query_words: Pre-tokenized, lowercased query words
+
         Returns:
             Relevance score (0.0 to 1.0)
         """
         score = 0.0
-        title = product.get('title', '').lower()
-        query_words = search_query.lower().split()
-        
-        # Title relevance (40% of score)
-        title_matches = sum(1 for word in query_words if word in title)
-        title_score = (title_matches / len(query_words)) * 0.4
-        score += title_score
+        title = (product.title or '').lower()
+
+        # Title relevance (40% of score): token-set intersection, and
+        # an empty query no longer divides by zero
+        qset = frozenset(query_words)
+        if qset:
+            title_matches = len(qset & set(title.split()))
+            score += (title_matches / len(qset)) * 0.4
         
         # Rating score (20% of score)
-        rating = product.get('rating', 0)
+        rating = product.rating or 0
         rating_score = (rating / 5.0) * 0.2
         score += rating_score
         
         # Reviews count score (15% of score)
-        reviews = product.get('reviews_count', 0)
+        reviews = product.reviews_count or 0
         if reviews > 0:
             # Logarithmic scale for reviews (1000+ reviews = full score)
-            import math
             reviews_score = min(math.log10(reviews) / 3.0, 1.0) * 0.15
             score += reviews_score
         
         # Prime eligibility bonus (10% of score)
-        if product.get('prime_eligible', False):
+        if product.prime_eligible:
             score += 0.1
         
         # Deal bonus (15% of score)
-        if product.get('is_deal', False):
-            discount = product.get('discount_percentage', 0)
+        if product.is_deal:
+            discount = product.discount_percentage or 0
             deal_score = min(discount / 50.0, 1.0) * 0.15  # Max at 50% discount
             score += deal_score
         
@@ -521,7 +1138,7 @@ class SerpApiClient:
                 return False
                 
         except Exception as e:
-            logger.error(f"SerpAPI connection test failed: {e}")
+            logger.error("SerpAPI connection test failed: %s", e)
             return False
     
     def get_account_info(self) -> Dict[str, Any]:
@@ -535,7 +1152,7 @@ class SerpApiClient:
             # SerpAPI account endpoint
             account_url = "https://serpapi.com/account.json"
             
-            response = requests.get(
+            response = self._session.get(
                 account_url,
                 params={"api_key": self.api_key},
                 timeout=self.timeout
@@ -548,5 +1165,5 @@ class SerpApiClient:
             return account_data
             
         except Exception as e:
-            logger.error(f"Failed to get SerpAPI account info: {e}")
+            logger.error("Failed to get SerpAPI account info: %s", e)
             return {}
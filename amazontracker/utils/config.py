@@ -4,8 +4,11 @@ Handles environment variables, settings validation, and configuration loading
 """
 
 import os
+import re
 from pathlib import Path
 from typing import Optional, List
+from functools import lru_cache
+
 from pydantic import validator, Field
 from pydantic_settings import BaseSettings
 
@@ -18,24 +21,16 @@ class Settings(BaseSettings):
     serpapi_timeout: int = 30
     serpapi_retries: int = 3
     serpapi_retry_delay: float = 1.0
+    serpapi_cache_ttl: float = 60.0  # Seconds to reuse search results for identical lookups
     
     # Database Configuration
     database_url: str = "sqlite:///./amazontracker.db"
     
     # Notification Settings
-    email_enabled: bool = True
     email_smtp_server: str = "smtp.gmail.com"
     email_smtp_port: int = 587
-    email_username: Optional[str] = None
-    email_password: Optional[str] = None
-    
-    slack_enabled: bool = False
-    slack_webhook_url: Optional[str] = None
-    
-    desktop_notifications_enabled: bool = True
     
     # Monitoring Configuration
-    default_check_interval: str = "1h"
     max_concurrent_checks: int = 5
     price_change_threshold: float = 5.0
     deal_threshold_percentage: float = 10.0
@@ -112,6 +107,35 @@ class Settings(BaseSettings):
     slack_channel: str = Field(default="#general", description="Slack channel")
     slack_username: str = Field(default="Amazon Tracker", description="Slack username")
     slack_icon_emoji: str = Field(default=":shopping_bags:", description="Slack icon emoji")
+    slack_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum concurrent Slack webhook posts"
+    )
+    slack_max_retries: int = Field(
+        default=4,
+        ge=0,
+        description="Retry attempts for transient Slack webhook failures"
+    )
+    slack_base_delay: float = Field(
+        default=0.5,
+        ge=0.0,
+        description="Base delay in seconds for Slack retry backoff"
+    )
+    slack_max_delay: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Maximum delay in seconds for Slack retry backoff"
+    )
+    slack_batch_interval: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds to coalesce price alerts into one Slack message (0 disables batching)"
+    )
+    slack_test_visible: bool = Field(
+        default=False,
+        description="Post a visible channel message when testing the Slack connection"
+    )
     
     # Desktop notifications
     desktop_notifications_enabled: bool = Field(default=True, description="Enable desktop notifications")
@@ -246,12 +270,14 @@ class LoggingConfig:
         }
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings instance once per process"""
+    return Settings()
 
-# Ensure log directory exists
-log_dir = Path(settings.log_file).parent
-log_dir.mkdir(exist_ok=True, parents=True)
+
+# Global settings instance
+settings = get_settings()
 
 # Environment-specific configurations
 DEVELOPMENT = settings.debug
@@ -270,21 +296,24 @@ RATE_LIMITS = {
     }
 }
 
-# Monitoring intervals in seconds
-INTERVALS = {
-    "5m": 300,
-    "15m": 900,
-    "30m": 1800,
-    "1h": 3600,
-    "2h": 7200,
-    "6h": 21600,
-    "12h": 43200,
-    "24h": 86400
-}
+# Interval strings are "<number><unit>" with s/m/h/d units
+_INTERVAL_RE = re.compile(r'^\s*(\d+)\s*([smhd])\s*$')
+_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
 
 def get_interval_seconds(interval_str: str) -> int:
-    """Convert interval string to seconds"""
-    return INTERVALS.get(interval_str, 3600)  # Default to 1 hour
+    """Convert an interval string like '30m' or '2h' to seconds"""
+    match = _INTERVAL_RE.match(interval_str or "")
+    if not match:
+        return 3600  # Default to 1 hour
+    return int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+
+
+# Monitoring intervals in seconds (compatibility shim over the parser)
+INTERVALS = {
+    key: get_interval_seconds(key)
+    for key in ("5m", "15m", "30m", "1h", "2h", "6h", "12h", "24h")
+}
 
 
 def validate_configuration() -> List[str]:
@@ -314,7 +343,27 @@ def validate_configuration() -> List[str]:
     return issues
 
 
-# Configuration validation on import
-config_issues = validate_configuration()
-if config_issues and not settings.debug:
-    raise RuntimeError(f"Configuration issues: {config_issues}")
+_initialized = False
+
+
+def init_config() -> Settings:
+    """
+    Run one-time filesystem setup and configuration validation
+
+    Deferred out of import time so test collection, subprocesses, and
+    worker forks importing this module do no disk I/O; entrypoints call
+    this explicitly before starting services.
+    """
+    global _initialized
+    if _initialized:
+        return settings
+
+    log_dir = Path(settings.log_file).parent
+    log_dir.mkdir(exist_ok=True, parents=True)
+
+    config_issues = validate_configuration()
+    if config_issues and not settings.debug:
+        raise RuntimeError(f"Configuration issues: {config_issues}")
+
+    _initialized = True
+    return settings
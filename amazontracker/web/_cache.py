@@ -0,0 +1,115 @@
+"""
+In-process TTL memoization helpers for web handlers
+
+Several dashboard endpoints fetch the same product list within a few
+seconds of each other; a short-lived cache lets concurrent requests
+share one ORM fetch instead of each materializing the full list.
+"""
+
+import asyncio
+
+from cachetools import TTLCache
+
+# Keyed by active_only flag; 15s is well under the shortest check
+# interval, so staleness is bounded and invisible in practice
+_products_cache = TTLCache(maxsize=4, ttl=15)
+_products_lock = asyncio.Lock()
+
+# Pre-serialized response payloads (bytes) keyed by endpoint name, so
+# repeat requests inside the window are a straight memcpy
+_payload_cache = TTLCache(maxsize=8, ttl=15)
+
+# Denormalized product counts; refreshed on expiry or mutation
+_counts_cache = TTLCache(maxsize=1, ttl=15)
+
+# ML inference results keyed by (kind, product_id, horizon); identical
+# requests inside the window skip the model entirely. Predictions are
+# deterministic for a given history, so new price rows clear these
+_prediction_cache = TTLCache(maxsize=256, ttl=3600)
+_analysis_cache = TTLCache(maxsize=256, ttl=900)
+
+
+async def cached_products(tracker, active_only: bool = True):
+    """
+    Fetch tracked products through a short-lived shared cache
+
+    Args:
+        tracker: PriceTracker instance to fetch from on a miss
+        active_only: Whether to restrict to active products
+
+    Returns:
+        List of Product rows (shared across callers within the TTL)
+    """
+    key = active_only
+    products = _products_cache.get(key)
+    if products is not None:
+        return products
+
+    async with _products_lock:
+        # Double-check: another request may have filled it while we
+        # waited on the lock
+        products = _products_cache.get(key)
+        if products is None:
+            # to_thread keeps the blocking ORM fetch off the event loop
+            products = await asyncio.to_thread(
+                tracker.get_products, active_only=active_only
+            )
+            _products_cache[key] = products
+        return products
+
+
+async def cached_product_counts(tracker):
+    """
+    Fetch product counts through a short-lived shared cache
+
+    Args:
+        tracker: PriceTracker instance to aggregate from on a miss
+
+    Returns:
+        Dict with total, active and inactive counts
+    """
+    counts = _counts_cache.get('counts')
+    if counts is not None:
+        return counts
+
+    async with _products_lock:
+        counts = _counts_cache.get('counts')
+        if counts is None:
+            counts = await asyncio.to_thread(tracker.get_product_counts)
+            _counts_cache['counts'] = counts
+        return counts
+
+
+def get_cached_prediction(kind: str, product_id: str, horizon: int):
+    """Return a memoized inference result, or None"""
+    cache = _prediction_cache if kind == 'predict' else _analysis_cache
+    return cache.get((kind, product_id, horizon))
+
+
+def set_cached_prediction(kind: str, product_id: str, horizon: int, result):
+    """Memoize an inference result"""
+    cache = _prediction_cache if kind == 'predict' else _analysis_cache
+    cache[(kind, product_id, horizon)] = result
+
+
+def clear_prediction_caches():
+    """Drop memoized inferences after new price data arrives"""
+    _prediction_cache.clear()
+    _analysis_cache.clear()
+
+
+def get_cached_payload(key: str):
+    """Return a pre-serialized response payload, or None"""
+    return _payload_cache.get(key)
+
+
+def set_cached_payload(key: str, payload: bytes):
+    """Store a pre-serialized response payload"""
+    _payload_cache[key] = payload
+
+
+def clear_products_cache():
+    """Drop memoized product lists and payloads after a mutation"""
+    _products_cache.clear()
+    _payload_cache.clear()
+    _counts_cache.clear()
@@ -2,30 +2,79 @@
 FastAPI web dashboard for Amazon Price Tracker
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Request, Form
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi import FastAPI, HTTPException, Depends, Request, Form, Response
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as _DefaultJSONResponse
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    _DefaultJSONResponse = JSONResponse
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from typing import Optional, List, Dict, Any
 import asyncio
 import json
+import numpy as np
 from datetime import datetime, timedelta
 
+try:
+    from fastapi_cache import FastAPICache
+    from fastapi_cache.backends.redis import RedisBackend
+    from fastapi_cache.decorator import cache
+    from redis import asyncio as aioredis
+    RESPONSE_CACHE_AVAILABLE = True
+except ImportError:
+    # Response caching is optional: without fastapi-cache2/redis the
+    # decorator degrades to a no-op and endpoints hit the DB directly
+    RESPONSE_CACHE_AVAILABLE = False
+
+    def cache(expire=0):
+        def decorator(func):
+            return func
+        return decorator
+
 from ..core.tracker import PriceTracker
 from ..services.price_monitor import PriceMonitor
+from ..services._state import monitor_state
 from ..notifications.manager import NotificationManager
 from ..ai.prediction import PricePredictionEngine
 from ..utils.config import settings
+from ._cache import (
+    cached_product_counts,
+    cached_products,
+    clear_prediction_caches,
+    clear_products_cache,
+    get_cached_payload,
+    get_cached_prediction,
+    set_cached_payload,
+    set_cached_prediction,
+)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Amazon Price Tracker",
     description="AI-powered Amazon price monitoring and alerts",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=_DefaultJSONResponse
 )
 
-# Templates and static files
+# JSON payloads here are highly repetitive (keys, ISO timestamps) and
+# compress well; level 5 keeps the CPU cost modest
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Templates and static files. Compiled templates stay cached even in
+# debug runs: auto_reload would re-stat and re-parse the template on
+# every dashboard hit
 templates = Jinja2Templates(directory="templates")
+templates.env.auto_reload = False
 
 # Global instances
 tracker = PriceTracker()
@@ -34,21 +83,46 @@ notification_manager = NotificationManager()
 prediction_engine = PricePredictionEngine()
 
 
+async def current_products() -> List[Any]:
+    """
+    Dependency yielding the product list, fetched once per request
+
+    FastAPI caches dependency results within a request, so handlers
+    (and sub-dependencies) that need the list share one lookup, which
+    itself goes through the short-lived shared cache.
+    """
+    return await cached_products(tracker, active_only=False)
+
+
+async def _clear_response_cache():
+    """Drop cached GET responses after a mutation"""
+    if RESPONSE_CACHE_AVAILABLE:
+        try:
+            await FastAPICache.clear(namespace="apt")
+        except Exception:
+            pass
+
+
 @app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    """Main dashboard page"""
+async def dashboard(request: Request, products: List[Any] = Depends(current_products)):
+    """Main dashboard page
+
+    Not wrapped in @cache: the response coder can't serialize a
+    TemplateResponse. The underlying data is memoized instead (product
+    list via cached_products, deal queries via the in-process caches),
+    so rendering is the only per-request work.
+    """
     try:
         # Get dashboard data
-        products = tracker.get_products(active_only=False)
-        active_products = [p for p in products if p.is_active]
-        deals = tracker.get_current_deals()
+        active_count = sum(1 for p in products if p.is_active)
+        deals = await asyncio.to_thread(tracker.get_current_deals)
         
         # Get notification stats
         notif_stats = notification_manager.get_notification_stats()
         
         dashboard_data = {
             "total_products": len(products),
-            "active_products": len(active_products),
+            "active_products": active_count,
             "current_deals": len(deals),
             "notifications_sent": notif_stats.get("sent", 0),
             "recent_deals": deals[:5],  # Top 5 deals
@@ -72,23 +146,29 @@ async def dashboard(request: Request):
 async def get_products():
     """Get all tracked products"""
     try:
-        products = tracker.get_products()
-        return {
-            "products": [
-                {
-                    "id": p.id,
-                    "name": p.name,
-                    "target_price": p.target_price,
-                    "current_price": getattr(p, 'current_price', None),
-                    "is_active": p.is_active,
-                    "check_interval": p.check_interval,
-                    "last_checked": p.last_checked_at.isoformat() if p.last_checked_at else None,
-                    "amazon_url": getattr(p, 'amazon_url', None),
-                    "search_query": p.search_query
-                }
-                for p in products
-            ]
-        }
+        # Serve pre-serialized bytes while the payload cache is warm;
+        # mutations clear it alongside the product list cache
+        payload = get_cached_payload("products")
+        if payload is None:
+            products = await asyncio.to_thread(tracker.get_products)
+            payload = _json_dumps({
+                "products": [
+                    {
+                        "id": p.id,
+                        "name": p.name,
+                        "target_price": p.target_price,
+                        "current_price": getattr(p, 'current_price', None),
+                        "is_active": p.is_active,
+                        "check_interval": p.check_interval,
+                        "last_checked": p.last_checked_at.isoformat() if p.last_checked_at else None,
+                        "amazon_url": getattr(p, 'amazon_url', None),
+                        "search_query": p.search_query
+                    }
+                    for p in products
+                ]
+            })
+            set_cached_payload("products", payload)
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -105,7 +185,8 @@ async def add_product(
         if not search_query and not asin:
             raise HTTPException(status_code=400, detail="Either search_query or asin must be provided")
         
-        result = tracker.add_product(
+        result = await asyncio.to_thread(
+            tracker.add_product,
             name=search_query or f"Product-{asin}",
             search_query=search_query or asin,
             target_price=target_price,
@@ -113,6 +194,8 @@ async def add_product(
         )
         
         if result:
+            clear_products_cache()
+            await _clear_response_cache()
             return {"success": True, "product": result}
         else:
             raise HTTPException(status_code=400, detail="Failed to add product")
@@ -125,8 +208,10 @@ async def add_product(
 async def remove_product(product_id: str):
     """Remove a tracked product"""
     try:
-        success = tracker.remove_product(product_id)
+        success = await asyncio.to_thread(tracker.remove_product, product_id)
         if success:
+            clear_products_cache()
+            await _clear_response_cache()
             return {"success": True}
         else:
             raise HTTPException(status_code=404, detail="Product not found")
@@ -138,8 +223,10 @@ async def remove_product(product_id: str):
 async def check_product_price(product_id: str):
     """Check price for a specific product"""
     try:
-        result = await tracker.check_product_price(product_id)
+        result = await asyncio.to_thread(tracker.check_product_price, product_id)
         if result:
+            clear_prediction_caches()
+            await _clear_response_cache()
             return {"success": True, "result": result}
         else:
             raise HTTPException(status_code=404, detail="Product not found")
@@ -152,6 +239,8 @@ async def check_all_prices():
     """Check prices for all products"""
     try:
         results = await tracker.check_all_prices()
+        clear_prediction_caches()
+        await _clear_response_cache()
         return {
             "success": True,
             "checked": len(results),
@@ -162,10 +251,11 @@ async def check_all_prices():
 
 
 @app.get("/api/deals")
+@cache(expire=60)
 async def get_current_deals():
     """Get current deals"""
     try:
-        deals = await tracker.get_current_deals()
+        deals = await asyncio.to_thread(tracker.get_current_deals)
         return {"deals": deals}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -173,23 +263,23 @@ async def get_current_deals():
 
 @app.get("/api/products/{product_id}/history")
 async def get_price_history(product_id: str, days: int = 30):
-    """Get price history for a product"""
+    """Stream price history for a product as NDJSON"""
     try:
-        history = await tracker.get_price_history(product_id, days)
-        return {
-            "product_id": product_id,
-            "history": [
-                {
+        def gen():
+            # Rows come from a chunked server-side iteration, so memory
+            # stays flat and the first line goes out immediately
+            for h in tracker.iter_price_history(product_id, days=days):
+                yield _json_dumps({
+                    "product_id": product_id,
                     "price": h.price,
                     "old_price": h.old_price,
                     "discount_percentage": h.discount_percentage,
                     "checked_at": h.checked_at.isoformat(),
                     "rating": h.rating,
                     "reviews_count": h.reviews_count
-                }
-                for h in history
-            ]
-        }
+                }) + b"\n"
+
+        return StreamingResponse(gen(), media_type="application/x-ndjson")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -198,7 +288,11 @@ async def get_price_history(product_id: str, days: int = 30):
 async def predict_price(product_id: str, days_ahead: int = 7):
     """Get AI price prediction for a product"""
     try:
-        prediction = await prediction_engine.predict_price(product_id, days_ahead)
+        prediction = get_cached_prediction('predict', product_id, days_ahead)
+        if prediction is None:
+            prediction = await prediction_engine.predict_price(product_id, days_ahead)
+            if prediction:
+                set_cached_prediction('predict', product_id, days_ahead, prediction)
         if prediction:
             return {"success": True, "prediction": prediction}
         else:
@@ -211,21 +305,27 @@ async def predict_price(product_id: str, days_ahead: int = 7):
 async def get_price_analysis(product_id: str, period_days: int = 30):
     """Get AI price analysis for a product"""
     try:
-        analysis = await prediction_engine.analyze_price_trends(product_id, period_days)
+        analysis = get_cached_prediction('analysis', product_id, period_days)
+        if analysis is None:
+            analysis = await prediction_engine.analyze_price_trends(product_id, period_days)
+            if analysis:
+                set_cached_prediction('analysis', product_id, period_days, analysis)
         return {"success": True, "analysis": analysis}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/monitoring/status")
+@cache(expire=10)
 async def get_monitoring_status():
     """Get monitoring service status"""
     try:
+        counts = await cached_product_counts(tracker)
         return {
-            "running": price_monitor.is_running(),
-            "next_check": price_monitor.get_next_check_time(),
-            "total_products": len(tracker.get_products(active_only=False)),
-            "active_products": len([p for p in tracker.get_products(active_only=False) if p.is_active])
+            "running": monitor_state.running,
+            "next_check": monitor_state.next_check,
+            "total_products": counts["total"],
+            "active_products": counts["active"]
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -255,44 +355,47 @@ async def stop_monitoring():
 async def test_notifications(notification_type: str = Form("all")):
     """Test notification systems"""
     try:
-        results = {}
-        
-        if notification_type in ["all", "email"]:
-            results["email"] = await notification_manager.send_test_notification("email")
-        
-        if notification_type in ["all", "slack"]:
-            results["slack"] = await notification_manager.send_test_notification("slack")
-        
-        if notification_type in ["all", "desktop"]:
-            results["desktop"] = await notification_manager.send_test_notification("desktop")
-        
+        channels = [
+            channel for channel in ("email", "slack", "desktop")
+            if notification_type in ("all", channel)
+        ]
+
+        # Each test hits a different external service; running them
+        # concurrently makes the wall time the slowest channel instead
+        # of the sum of all three
+        outcomes = await asyncio.gather(
+            *(notification_manager.send_test_notification(c) for c in channels),
+            return_exceptions=True
+        )
+        results = {
+            channel: outcome if not isinstance(outcome, Exception) else False
+            for channel, outcome in zip(channels, outcomes)
+        }
+
         return {"success": True, "results": results}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/stats")
+@cache(expire=60)
 async def get_statistics():
     """Get application statistics"""
     try:
-        products = tracker.get_products(active_only=False)
-        deals = tracker.get_current_deals()
+        counts = await cached_product_counts(tracker)
+        deals = await asyncio.to_thread(tracker.get_current_deals)
         notif_stats = notification_manager.get_notification_stats()
-        
+
         return {
-            "products": {
-                "total": len(products),
-                "active": len([p for p in products if p.is_active]),
-                "inactive": len([p for p in products if p.status != "active"])
-            },
+            "products": counts,
             "deals": {
                 "current": len(deals),
                 "total_savings": sum(d.get('savings', 0) for d in deals)
             },
             "notifications": notif_stats,
             "monitoring": {
-                "running": price_monitor.is_running(),
-                "next_check": price_monitor.get_next_check_time()
+                "running": monitor_state.running,
+                "next_check": monitor_state.next_check
             }
         }
     except Exception as e:
@@ -300,15 +403,24 @@ async def get_statistics():
 
 
 @app.get("/api/charts/price-trends")
-async def get_price_trends_data():
+@cache(expire=300)
+async def get_price_trends_data(products: List[Any] = Depends(current_products)):
     """Get data for price trends chart"""
     try:
-        # Get all products with recent price history
-        products = tracker.get_products(active_only=False)
         chart_data = []
         
-        for product in products[:10]:  # Limit to 10 products for performance
-            history = tracker.get_price_history(product.id, 30)
+        # One IN query for all charted products instead of a query per
+        # product
+        charted = products[:10]  # Limit to 10 products for performance
+        histories = await asyncio.to_thread(
+            tracker.get_price_histories_bulk,
+            [product.id for product in charted],
+            days=30,
+            per_product_limit=30
+        )
+
+        for product in charted:
+            history = histories.get(product.id)
             if history:
                 product_data = {
                     "name": product.name[:20] + "..." if len(product.name) > 20 else product.name,
@@ -317,7 +429,7 @@ async def get_price_trends_data():
                             "x": h.checked_at.isoformat(),
                             "y": float(h.price)
                         }
-                        for h in history[-30:]  # Last 30 data points
+                        for h in history  # Query already limited to 30 rows
                     ]
                 }
                 chart_data.append(product_data)
@@ -328,37 +440,25 @@ async def get_price_trends_data():
 
 
 @app.get("/api/charts/deals-distribution")
+@cache(expire=300)
 async def get_deals_distribution_data():
     """Get data for deals distribution chart"""
     try:
-        deals = await tracker.get_current_deals()
-        
-        # Group deals by savings range
-        savings_ranges = {
-            "0-10": 0,
-            "10-25": 0,
-            "25-50": 0,
-            "50-100": 0,
-            "100+": 0
-        }
-        
-        for deal in deals:
-            savings = deal.get('savings', 0)
-            if savings < 10:
-                savings_ranges["0-10"] += 1
-            elif savings < 25:
-                savings_ranges["10-25"] += 1
-            elif savings < 50:
-                savings_ranges["25-50"] += 1
-            elif savings < 100:
-                savings_ranges["50-100"] += 1
-            else:
-                savings_ranges["100+"] += 1
-        
+        deals = await asyncio.to_thread(tracker.get_current_deals)
+
+        # Bucket savings with one vectorized histogram instead of a
+        # per-deal if/elif cascade in the interpreter
+        savings = np.fromiter(
+            (deal.get('savings', 0) for deal in deals),
+            dtype=np.float32,
+            count=len(deals)
+        )
+        counts, _ = np.histogram(savings, bins=[0, 10, 25, 50, 100, np.inf])
+
         return {
             "chart_data": {
-                "labels": list(savings_ranges.keys()),
-                "values": list(savings_ranges.values())
+                "labels": ["0-10", "10-25", "25-50", "50-100", "100+"],
+                "values": [int(c) for c in counts]
             }
         }
     except Exception as e:
@@ -403,6 +503,29 @@ async def server_error_handler(request: Request, exc: HTTPException):
 async def startup_event():
     """Initialize application on startup"""
     try:
+        # Run deferred configuration setup (log dirs, validation)
+        from ..utils.config import init_config
+        init_config()
+
+        # Pre-warm the compiled template cache so the first dashboard
+        # request doesn't pay the parse cost
+        try:
+            templates.get_template("dashboard.html")
+        except Exception:
+            pass
+
+        # Response cache for read-heavy GET endpoints; the data only
+        # changes when a scheduled check fires, so short TTLs collapse
+        # repeated dashboard hits into one Redis lookup
+        if RESPONSE_CACHE_AVAILABLE:
+            try:
+                FastAPICache.init(
+                    RedisBackend(aioredis.from_url(settings.redis_url)),
+                    prefix="apt"
+                )
+            except Exception as e:
+                print(f"Response cache unavailable: {e}")
+
         # Initialize database
         from ..database.connection import init_database
         init_database()
@@ -420,13 +543,32 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     try:
         # Stop monitoring
-        if price_monitor.is_running():
-            await price_monitor.stop()
-            
+        if price_monitor.is_running:
+            price_monitor.stop()
+
+        # Release the tracker's pooled SerpApi connections
+        await tracker.serpapi_client.aclose()
+
     except Exception as e:
         print(f"Error during shutdown: {e}")
 
 
+def _uvicorn_speedups() -> Dict[str, str]:
+    """Pick uvloop/httptools when installed, else uvicorn's defaults"""
+    kwargs = {}
+    try:
+        import uvloop  # noqa: F401
+        kwargs["loop"] = "uvloop"
+    except ImportError:
+        pass
+    try:
+        import httptools  # noqa: F401
+        kwargs["http"] = "httptools"
+    except ImportError:
+        pass
+    return kwargs
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -434,5 +576,6 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        workers=settings.workers if not settings.debug else 1
+        workers=settings.workers if not settings.debug else 1,
+        **_uvicorn_speedups()
     )
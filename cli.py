@@ -10,6 +10,7 @@ Email: alaa@serpapi.com
 
 import asyncio
 import argparse
+import signal
 import sys
 import os
 from pathlib import Path
@@ -24,11 +25,33 @@ from amazontracker.database.connection import init_database
 from amazontracker.services.price_monitor import PriceMonitor
 from amazontracker.notifications.manager import NotificationManager
 
+# Lazily constructed singletons: building a PriceTracker spins up the
+# SerpApi client, prediction engine and notification stack, so commands
+# share one instance instead of paying that cost per call site
+_tracker = None
+_notification_manager = None
+
+
+def get_tracker() -> PriceTracker:
+    """Return the shared PriceTracker, creating it on first use"""
+    global _tracker
+    if _tracker is None:
+        _tracker = PriceTracker()
+    return _tracker
+
+
+def get_notification_manager() -> NotificationManager:
+    """Return the shared NotificationManager, creating it on first use"""
+    global _notification_manager
+    if _notification_manager is None:
+        _notification_manager = NotificationManager()
+    return _notification_manager
+
 
 async def add_product(args):
     """Add a new product to track"""
     try:
-        tracker = PriceTracker()
+        tracker = get_tracker()
         
         # Add product with provided parameters
         result = tracker.add_product(
@@ -54,7 +77,7 @@ async def add_product(args):
 async def list_products(args):
     """List all tracked products"""
     try:
-        tracker = PriceTracker()
+        tracker = get_tracker()
         products = tracker.get_products()
         
         if not products:
@@ -79,7 +102,7 @@ async def list_products(args):
 async def check_prices(args):
     """Check prices for all products or specific product"""
     try:
-        tracker = PriceTracker()
+        tracker = get_tracker()
         
         if args.product_id:
             # Check specific product
@@ -90,15 +113,29 @@ async def check_prices(args):
             else:
                 print(f"❌ Failed to check price for product {args.product_id}")
         else:
-            # Check all products
+            # Check all products concurrently: each check is a network
+            # round-trip, so overlapping them turns N serial waits into
+            # roughly one. The semaphore keeps the fan-out within the
+            # SerpApi rate limit
             products = tracker.get_products(active_only=True)
-            results = []
-            for product in products:
-                result = tracker.check_product_price(product.id)
-                if result:
-                    results.append(result)
-            
-            print(f"✅ Checked {len(results)} products")
+            semaphore = asyncio.Semaphore(10)
+
+            async def check_one(product_id):
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        tracker.check_product_price, product_id
+                    )
+
+            results = await asyncio.gather(
+                *(check_one(product.id) for product in products),
+                return_exceptions=True
+            )
+            checked = sum(
+                1 for r in results
+                if r is not None and not isinstance(r, Exception)
+            )
+
+            print(f"✅ Checked {checked} products")
                 
     except Exception as e:
         print(f"❌ Error checking prices: {e}")
@@ -115,7 +152,7 @@ async def start_monitoring(args):
         
         # Start price monitor
         monitor = PriceMonitor()
-        await monitor.start()
+        monitor.start()
         print("✅ Price monitoring started")
         
         print("\n📊 Monitoring is now running. Press Ctrl+C to stop.")
@@ -124,14 +161,21 @@ async def start_monitoring(args):
         print(f"💬 Slack notifications: {'Enabled' if settings.slack_enabled else 'Disabled'}")
         print(f"🖥️ Desktop notifications: {'Enabled' if settings.desktop_notifications_enabled else 'Disabled'}")
         
-        # Keep running until interrupted
-        try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
-            print("\n🛑 Stopping monitoring service...")
-            await monitor.stop()
-            print("✅ Monitoring service stopped")
+        # Sleep until a signal arrives instead of polling every second
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                # Signal handlers are unavailable on some platforms;
+                # fall back to KeyboardInterrupt from asyncio.run
+                pass
+
+        await stop_event.wait()
+        print("\n🛑 Stopping monitoring service...")
+        monitor.stop()
+        print("✅ Monitoring service stopped")
             
     except Exception as e:
         print(f"❌ Error starting monitoring: {e}")
@@ -142,32 +186,35 @@ async def test_notifications(args):
     try:
         print("🧪 Testing notification systems...")
         
-        notification_manager = NotificationManager()
-        
-        # Test each notification type
-        if args.type == "all" or args.type == "email":
-            if notification_manager.email_sender:
-                print("📧 Testing email notification...")
-                success = await notification_manager.send_test_notification("email")
-                print(f"   Email: {'✅ Success' if success else '❌ Failed'}")
-            else:
-                print("   Email: ⏭️ Disabled")
-        
-        if args.type == "all" or args.type == "slack":
-            if notification_manager.slack_sender:
-                print("💬 Testing Slack notification...")
-                success = await notification_manager.send_test_notification("slack")
-                print(f"   Slack: {'✅ Success' if success else '❌ Failed'}")
-            else:
-                print("   Slack: ⏭️ Disabled")
-        
-        if args.type == "all" or args.type == "desktop":
-            if notification_manager.desktop_notifier:
-                print("🖥️ Testing desktop notification...")
-                success = await notification_manager.send_test_notification("desktop")
-                print(f"   Desktop: {'✅ Success' if success else '❌ Failed'}")
-            else:
-                print("   Desktop: ⏭️ Disabled")
+        notification_manager = get_notification_manager()
+
+        channels = {
+            "email": ("Email", notification_manager.email_sender),
+            "slack": ("Slack", notification_manager.slack_sender),
+            "desktop": ("Desktop", notification_manager.desktop_notifier),
+        }
+        enabled = [
+            channel for channel, (_, sender) in channels.items()
+            if (args.type == "all" or args.type == channel) and sender
+        ]
+
+        # Run the enabled channel tests concurrently; total time is the
+        # slowest external service, not the sum
+        outcomes = await asyncio.gather(
+            *(notification_manager.send_test_notification(c) for c in enabled),
+            return_exceptions=True
+        )
+        results = dict(zip(enabled, outcomes))
+
+        for channel, (label, sender) in channels.items():
+            if args.type != "all" and args.type != channel:
+                continue
+            if not sender:
+                print(f"   {label}: ⏭️ Disabled")
+                continue
+            outcome = results.get(channel)
+            success = outcome is True
+            print(f"   {label}: {'✅ Success' if success else '❌ Failed'}")
                 
     except Exception as e:
         print(f"❌ Error testing notifications: {e}")
@@ -176,7 +223,7 @@ async def test_notifications(args):
 async def show_stats(args):
     """Show tracking statistics"""
     try:
-        tracker = PriceTracker()
+        tracker = get_tracker()
         
         # Get basic stats
         products = tracker.get_products(active_only=False)
@@ -197,7 +244,7 @@ async def show_stats(args):
                 print(f"    Target: ${deal.target_price:.2f}")
         
         # Notification stats
-        notification_manager = NotificationManager()
+        notification_manager = get_notification_manager()
         notif_stats = notification_manager.get_notification_stats()
         if notif_stats:
             print(f"\n📨 Notification Statistics:")
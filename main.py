@@ -56,7 +56,16 @@ Examples:
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
     
     args, remaining = parser.parse_known_args()
-    
+
+    # One-time configuration setup (log dirs, validation) deferred out
+    # of module import
+    try:
+        from amazontracker.utils.config import init_config
+        init_config()
+    except Exception as e:
+        print(f"❌ Configuration error: {e}")
+        sys.exit(1)
+
     if args.mode == "web":
         start_web_server(args)
     elif args.mode == "cli":
@@ -78,14 +87,15 @@ def start_web_server(args):
     
     try:
         import uvicorn
-        from amazontracker.web.app import app
+        from amazontracker.web.app import app, _uvicorn_speedups
         
         uvicorn.run(
             app,
             host=args.host,
             port=args.port,
             reload=args.reload,
-            access_log=True
+            access_log=True,
+            **_uvicorn_speedups()
         )
     except ImportError:
         print("❌ Error: uvicorn not installed. Run: pip install uvicorn")
@@ -211,25 +221,38 @@ def run_setup():
 
 def check_requirements():
     """Check if required packages are installed"""
+    from importlib.util import find_spec
+
+    # Core packages every mode needs
     required_packages = [
-        ("fastapi", "fastapi"),
-        ("uvicorn", "uvicorn"),
         ("sqlalchemy", "sqlalchemy"),
         ("pydantic", "pydantic"),
         ("requests", "requests"),
-        ("aiohttp", "aiohttp"),
         ("apscheduler", "apscheduler"),
-        ("pandas", "pandas"),
-        ("numpy", "numpy"),
-        ("sklearn", "scikit-learn")
     ]
-    
+
+    # Mode-specific packages: don't make `cli --help` pay for the web
+    # stack or the ML stack
+    mode = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith("-") else "web"
+    if mode == "web":
+        required_packages += [
+            ("fastapi", "fastapi"),
+            ("uvicorn", "uvicorn"),
+        ]
+    if mode in ("web", "monitor"):
+        required_packages += [
+            ("httpx", "httpx"),
+            ("pandas", "pandas"),
+            ("numpy", "numpy"),
+            ("sklearn", "scikit-learn"),
+        ]
+
     missing_packages = []
-    
+
     for import_name, package_name in required_packages:
-        try:
-            __import__(import_name)
-        except ImportError:
+        # find_spec confirms the package is installed without importing
+        # it, so startup stays fast for modes that never use it
+        if find_spec(import_name) is None:
             missing_packages.append(package_name)
     
     if missing_packages:
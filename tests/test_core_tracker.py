@@ -3,6 +3,7 @@ Comprehensive tests for the PriceTracker core functionality
 Tests all product management, price checking, and monitoring features
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, MagicMock, call
 from datetime import datetime, timedelta
@@ -283,6 +284,7 @@ class TestPriceTracker:
             mock_query = Mock()
             mock_session_context.query.return_value = mock_query
             mock_query.join.return_value = mock_query
+            mock_query.options.return_value = mock_query
             mock_query.filter.return_value = mock_query
             mock_query.order_by.return_value = mock_query
             mock_query.limit.return_value = mock_query
@@ -333,9 +335,52 @@ class TestPriceTracker:
             mock_session_context.query.return_value.filter.return_value.first.return_value = None
             
             result = tracker.check_product_price(product_id)
-            
+
             assert result is None
 
+    def test_check_all_prices_deduplicates_concurrent_asin_lookups(self, tracker, mock_price_history):
+        """Test that concurrent checks of one ASIN share a single SerpApi request"""
+        shared_asin = "B0TESTASIN"
+        products = []
+        for _ in range(6):
+            product = Mock(spec=Product)
+            product.id = str(uuid.uuid4())
+            product.name = "Duplicate Product"
+            product.asin = shared_asin
+            product.is_active = True
+            products.append(product)
+
+        client = tracker.price_monitor.serpapi_client
+        upstream_calls = []
+
+        async def fake_search(query, **kwargs):
+            upstream_calls.append(query)
+            # Keep the request on the wire long enough for the other
+            # checks to arrive and join the in-flight lookup
+            await asyncio.sleep(0.1)
+            return {"products": [{"asin": shared_asin, "price": 49.99}]}
+
+        async def fake_check(product):
+            await client.get_product_by_asin_async(product.asin)
+            return mock_price_history
+
+        with patch('amazontracker.core.tracker.get_db_session') as mock_session:
+            mock_session_context = Mock()
+            mock_session.return_value.__enter__.return_value = mock_session_context
+            mock_session_context.query.return_value.filter.return_value.first.return_value = products[0]
+
+            with patch.object(client, 'search_amazon_products_async', side_effect=fake_search):
+                with patch.object(tracker.price_monitor, 'check_single_product', side_effect=fake_check):
+                    with patch.object(tracker, 'get_products', return_value=products):
+                        results = asyncio.run(tracker.check_all_prices())
+
+        assert len(results) == 6
+        assert all(result["success"] for result in results)
+        # Each check runs asyncio.run on its own thread, so every
+        # lookup arrives from a different event loop; the single-flight
+        # guard must still collapse them into one upstream request
+        assert len(upstream_calls) == 1
+
     def test_start_monitoring(self, tracker):
         """Test starting price monitoring"""
         with patch.object(tracker.price_monitor, 'start') as mock_start:
@@ -3,6 +3,8 @@ Comprehensive tests for SerpApi client functionality
 Tests all API interactions, search operations, and data parsing
 """
 
+import json
+
 import pytest
 import requests
 from unittest.mock import Mock, patch, MagicMock
@@ -33,7 +35,8 @@ class TestSerpApiClientInitialization:
         assert client.timeout == 30
         assert client.retries == 3
         assert client.retry_delay == 1.0
-        assert client.min_request_interval == 1.0
+        assert client._bucket.capacity == 10
+        assert client._bucket.rate == 1.0  # 60 requests/minute
 
 
 class TestSerpApiClientSearchOperations:
@@ -43,12 +46,13 @@ class TestSerpApiClientSearchOperations:
     def client(self):
         return SerpApiClient(api_key="test_key_12345678901234567890123456789012")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_products_success(self, mock_get, client, mock_serpapi_response):
         """Test successful product search"""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_serpapi_response
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
         
         results = client.search_amazon_products("iPhone 15")
@@ -56,12 +60,13 @@ class TestSerpApiClientSearchOperations:
         assert isinstance(results, dict)
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_products_by_asin_success(self, mock_get, client, mock_serpapi_response):
         """Test successful product search by ASIN"""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_serpapi_response
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
         
         result = client.get_product_by_asin("B0CHX1W1XY")
@@ -70,7 +75,7 @@ class TestSerpApiClientSearchOperations:
         # Result can be None if no exact match found
         assert result is None or isinstance(result, dict)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_products_api_error(self, mock_get, client):
         """Test handling of API errors"""
         mock_response = Mock()
@@ -88,7 +93,7 @@ class TestSerpApiClientSearchOperations:
             # Exception is also acceptable
             pass
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_products_network_timeout(self, mock_get, client):
         """Test handling of network timeouts"""
         mock_get.side_effect = requests.Timeout("Request timed out")
@@ -101,7 +106,7 @@ class TestSerpApiClientSearchOperations:
             # Exception is also acceptable
             pass
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_products_connection_error(self, mock_get, client):
         """Test handling of connection errors"""
         mock_get.side_effect = requests.ConnectionError("Connection failed")
@@ -114,7 +119,7 @@ class TestSerpApiClientSearchOperations:
             # Exception is also acceptable
             pass
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_products_with_retry_logic(self, mock_get, client):
         """Test retry logic on transient failures"""
         # Set up retry behavior
@@ -124,7 +129,7 @@ class TestSerpApiClientSearchOperations:
         mock_get.side_effect = [
             requests.Timeout("Timeout 1"),
             requests.Timeout("Timeout 2"),
-            Mock(status_code=200, json=lambda: {"search_results": []})
+            Mock(status_code=200, content=b'{"search_results": []}')
         ]
         
         try:
@@ -338,12 +343,13 @@ class TestSerpApiClientRateLimiting:
         return SerpApiClient(api_key="test_key")
     
     @patch('time.sleep')
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_rate_limiting_enforcement(self, mock_get, mock_sleep, client):
         """Test rate limiting prevents excessive API calls"""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"search_results": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
         
         # Make rapid requests
@@ -365,7 +371,7 @@ class TestSerpApiClientRateLimiting:
         else:
             assert True
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_quota_exceeded_handling(self, mock_get, client):
         """Test handling when API quota is exceeded"""
         mock_response = Mock()
@@ -390,7 +396,7 @@ class TestSerpApiClientCaching:
     def client(self):
         return SerpApiClient(api_key="test_key")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_cache_hit_avoids_api_call(self, mock_get, client):
         """Test cache hit avoids making API call"""
         if hasattr(client, 'enable_caching'):
@@ -402,6 +408,7 @@ class TestSerpApiClientCaching:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"search_results": [{"title": "test"}]}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
         
         # First call
@@ -417,7 +424,7 @@ class TestSerpApiClientCaching:
         assert second_call_count >= first_call_count
     
     @patch('time.time')
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_cache_expiry(self, mock_get, mock_time, client):
         """Test cache expires after configured time"""
         if hasattr(client, 'enable_caching'):
@@ -430,6 +437,7 @@ class TestSerpApiClientCaching:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"search_results": []}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
         
         # First call
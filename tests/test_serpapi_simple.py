@@ -3,6 +3,8 @@ Simple tests for SerpApi client functionality
 Tests basic initialization and key functionality only
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 from amazontracker.services.serpapi_client import SerpApiClient, SerpApiError
@@ -49,7 +51,7 @@ def sample_client():
 class TestSerpApiClientSearch:
     """Test search functionality"""
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_by_query_basic(self, mock_get, sample_client):
         """Test basic search by query"""
         # Mock successful response
@@ -64,6 +66,7 @@ class TestSerpApiClientSearch:
                 }
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
         
         # Test search
@@ -75,7 +78,7 @@ class TestSerpApiClientSearch:
         # Check if results contain expected data (flexible check)
         assert isinstance(results, (list, dict))
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_handles_errors(self, mock_get, sample_client):
         """Test search handles API errors gracefully"""
         # Mock error response